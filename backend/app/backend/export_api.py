@@ -6,16 +6,22 @@ and advanced export management.
 """
 
 from fastapi import APIRouter, HTTPException, BackgroundTasks, Query
-from fastapi.responses import FileResponse
-from pydantic import BaseModel, Field
-from typing import Dict, List, Optional, Any
+from fastapi.responses import FileResponse, Response
+from pydantic import BaseModel, Field, PrivateAttr, computed_field
+from typing import Dict, List, Optional, Tuple, Any
 import os
 import uuid
-import json
 import asyncio
+import time
+from collections import OrderedDict
+from contextlib import suppress
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import fields, replace
+from functools import partial
 from datetime import datetime
 
 from .export_profiles import export_profiles_service, ExportCategory, ExportProfile
+from .serialization import dumps
 from ..video_backend.ffmpeg_pipeline import FFMpegPipeline
 from ..timeline import Timeline
 import logging
@@ -24,6 +30,18 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/export", tags=["export"])
 
+BYTES_PER_MB = 1024 * 1024
+EXPORT_DIR = "/tmp/exports"
+MAX_JOBS = 1024
+CLEANUP_INTERVAL_SECONDS = 3600
+
+CONTAINER_MEDIA_TYPES = {
+    "mp4": "video/mp4",
+    "mov": "video/quicktime",
+    "webm": "video/webm",
+    "mkv": "video/x-matroska"
+}
+
 # ================== REQUEST/RESPONSE MODELS ==================
 
 class ExportRequest(BaseModel):
@@ -50,11 +68,28 @@ class ExportJob(BaseModel):
     progress: float = 0.0
     estimated_size_mb: Optional[float] = None
     file_size_mb: Optional[float] = None
-    created_at: datetime
-    started_at: Optional[datetime] = None
-    completed_at: Optional[datetime] = None
     error_message: Optional[str] = None
     download_url: Optional[str] = None
+    
+    # Raw epoch timestamps; datetimes are only materialized for serialization
+    _created_ts: float = PrivateAttr(default_factory=time.time)
+    _started_ts: Optional[float] = PrivateAttr(default=None)
+    _completed_ts: Optional[float] = PrivateAttr(default=None)
+    
+    @computed_field
+    @property
+    def created_at(self) -> datetime:
+        return datetime.fromtimestamp(self._created_ts)
+    
+    @computed_field
+    @property
+    def started_at(self) -> Optional[datetime]:
+        return datetime.fromtimestamp(self._started_ts) if self._started_ts is not None else None
+    
+    @computed_field
+    @property
+    def completed_at(self) -> Optional[datetime]:
+        return datetime.fromtimestamp(self._completed_ts) if self._completed_ts is not None else None
 
 
 class ExportProfileResponse(BaseModel):
@@ -87,30 +122,59 @@ class ExportJobManager:
     """Manages export jobs and progress tracking"""
     
     def __init__(self):
-        self._jobs: Dict[str, ExportJob] = {}
+        # Insertion-ordered so the oldest jobs are evicted first once MAX_JOBS is hit
+        self._jobs: "OrderedDict[str, ExportJob]" = OrderedDict()
         self._active_jobs: Dict[str, asyncio.Task] = {}
+        self._cleanup_task: Optional[asyncio.Task] = None
+        # Serialized /export/jobs payload, rebuilt only after a job changes
+        self._jobs_json: Optional[bytes] = None
+        self._jobs_json_dirty = True
     
-    def create_job(self, profile_id: str, output_path: str, timeline_duration: float = None) -> str:
-        """Create a new export job"""
-        job_id = str(uuid.uuid4())
+    def create_job(self, profile: ExportProfile, output_path: str,
+                   timeline_duration: Optional[float] = None) -> Tuple[str, ExportJob]:
+        """Create a new export job for an already-resolved profile; returns (job_id, job)"""
+        job_id = uuid.uuid4().hex
         
         # Estimate file size if possible
-        profile = export_profiles_service.get_profile(profile_id)
         estimated_size = None
-        if profile and timeline_duration:
+        if timeline_duration:
             estimated_size = export_profiles_service.estimate_file_size(profile, timeline_duration)
         
         job = ExportJob(
             job_id=job_id,
             status="queued",
-            profile_id=profile_id,
+            profile_id=profile.id,
             output_path=output_path,
-            estimated_size_mb=estimated_size,
-            created_at=datetime.now()
+            estimated_size_mb=estimated_size
         )
         
         self._jobs[job_id] = job
-        return job_id
+        self._jobs_json_dirty = True
+        self._evict_overflow()
+        return job_id, job
+    
+    def _evict_overflow(self):
+        """Drop the oldest finished jobs (and their files) beyond MAX_JOBS"""
+        overflow = len(self._jobs) - MAX_JOBS
+        if overflow <= 0:
+            return
+        
+        evicted = []
+        for job_id, job in self._jobs.items():
+            if len(evicted) >= overflow:
+                break
+            if job.status not in ("queued", "processing"):
+                evicted.append(job_id)
+        
+        if evicted:
+            self._jobs_json_dirty = True
+        for job_id in evicted:
+            job = self._jobs.pop(job_id)
+            self._active_jobs.pop(job_id, None)
+            try:
+                os.unlink(job.output_path)
+            except OSError:
+                pass
     
     def get_job(self, job_id: str) -> Optional[ExportJob]:
         """Get job by ID"""
@@ -120,23 +184,42 @@ class ExportJobManager:
         """Get all jobs"""
         return list(self._jobs.values())
     
+    def get_all_jobs_json(self) -> bytes:
+        """Get all jobs serialized as JSON, reusing the last payload if nothing changed"""
+        if self._jobs_json_dirty or self._jobs_json is None:
+            # Cleared first so a change made while dumping marks the result stale
+            self._jobs_json_dirty = False
+            self._jobs_json = dumps([job.model_dump(mode="json") for job in self._jobs.values()])
+        return self._jobs_json
+    
+    def set_progress(self, job_id: str, progress: float):
+        """Update only the progress of a running job (no status transition)"""
+        job = self._jobs.get(job_id)
+        if job:
+            job.progress = progress
+            self._jobs_json_dirty = True
+    
     def update_job_status(self, job_id: str, status: str, progress: float = None, error: str = None):
         """Update job status"""
         if job_id in self._jobs:
             job = self._jobs[job_id]
+            self._jobs_json_dirty = True
             job.status = status
             if progress is not None:
                 job.progress = progress
             if error:
                 job.error_message = error
-            if status == "processing" and not job.started_at:
-                job.started_at = datetime.now()
+            if status == "processing" and job._started_ts is None:
+                job._started_ts = time.time()
             elif status in ["completed", "failed", "cancelled"]:
-                job.completed_at = datetime.now()
-                # Calculate actual file size
-                if status == "completed" and os.path.exists(job.output_path):
-                    job.file_size_mb = os.path.getsize(job.output_path) / (1024 * 1024)
-                    job.download_url = f"/export/download/{job_id}"
+                job._completed_ts = time.time()
+                # Calculate actual file size (single stat; missing output is not an error here)
+                if status == "completed":
+                    try:
+                        job.file_size_mb = os.stat(job.output_path).st_size / BYTES_PER_MB
+                        job.download_url = f"/export/download/{job_id}"
+                    except FileNotFoundError:
+                        pass
     
     def cancel_job(self, job_id: str) -> bool:
         """Cancel an export job"""
@@ -150,32 +233,128 @@ class ExportJobManager:
     
     def cleanup_old_jobs(self, max_age_hours: int = 24):
         """Clean up old completed jobs"""
-        cutoff = datetime.now().timestamp() - (max_age_hours * 3600)
-        to_remove = []
+        cutoff = time.time() - (max_age_hours * 3600)
         
-        for job_id, job in self._jobs.items():
-            if job.completed_at and job.completed_at.timestamp() < cutoff:
-                to_remove.append(job_id)
-                # Remove output file if it exists
-                if os.path.exists(job.output_path):
-                    try:
-                        os.remove(job.output_path)
-                    except:
-                        pass
+        expired = [
+            job_id for job_id, job in self._jobs.items()
+            if job._completed_ts is not None and job._completed_ts < cutoff
+        ]
+        if not expired:
+            return
+        
+        # Single directory walk instead of exists+remove per job
+        pending = {self._jobs[job_id].output_path for job_id in expired}
+        try:
+            with os.scandir(EXPORT_DIR) as entries:
+                for entry in entries:
+                    if entry.path in pending:
+                        pending.discard(entry.path)
+                        try:
+                            os.unlink(entry.path)
+                        except OSError:
+                            pass
+        except OSError:
+            pass
+        
+        # Outputs written outside the export directory
+        for path in pending:
+            if os.path.dirname(path) != EXPORT_DIR:
+                try:
+                    os.unlink(path)
+                except OSError:
+                    pass
         
-        for job_id in to_remove:
+        for job_id in expired:
             del self._jobs[job_id]
+        self._jobs_json_dirty = True
+
+
+    async def run_periodic_cleanup(self, interval_seconds: int = CLEANUP_INTERVAL_SECONDS):
+        """Periodically clean up old jobs so the registry doesn't rely on POST /cleanup"""
+        while True:
+            await asyncio.sleep(interval_seconds)
+            try:
+                self.cleanup_old_jobs()
+            except Exception as e:
+                logger.error(f"Periodic export cleanup failed: {e}")
 
 
 # Global job manager
 job_manager = ExportJobManager()
 
+
+async def start_export_cleanup():
+    """Start the periodic export cleanup task (run from the app lifespan)"""
+    # Keep a reference so the task isn't garbage collected
+    job_manager._cleanup_task = asyncio.create_task(job_manager.run_periodic_cleanup())
+
+
+async def stop_export_cleanup():
+    """Cancel the periodic export cleanup task and wait for it to finish"""
+    task, job_manager._cleanup_task = job_manager._cleanup_task, None
+    if task is not None:
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
+
 # ================== EXPORT PROCESSING ==================
 
+_PROFILE_FIELDS = frozenset(f.name for f in fields(ExportProfile))
+
+# Resolved once; the pipeline class doesn't change at runtime
+_PIPELINE_HAS_PROFILE_EXPORT = hasattr(FFMpegPipeline, "render_export_with_profile")
+
+# Legacy render_export quality for each profile when profile-aware export is unavailable
+LEGACY_QUALITY_MAP = {
+    "youtube_1080p_h264": "high",
+    "youtube_4k_h264": "high",
+    "web_1080p_h264": "high",
+    "web_720p_h264": "medium",
+    "mobile_720p_h264": "medium",
+    "instagram_feed_1080": "medium",
+    "instagram_story_1080": "medium",
+    "tiktok_1080": "medium"
+}
+
+# Renders shell out to ffmpeg, so threads are enough; the pool is kept separate
+# from the default executor and its size bounds concurrent encodes
+RENDER_WORKERS = max(1, (os.cpu_count() or 2) // 2)
+_render_executor = ThreadPoolExecutor(max_workers=RENDER_WORKERS, thread_name_prefix="export-render")
+_render_slots = asyncio.Semaphore(RENDER_WORKERS)
+
+def _fast_duration(timeline_dict: Dict[str, Any]) -> Optional[float]:
+    """Estimate timeline duration in seconds straight from the serialized dict.
+    
+    Mirrors the frame/seconds handling of VideoClip.from_dict without building
+    a Timeline, which only happens once the export job actually renders.
+    """
+    try:
+        frame_rate = timeline_dict.get("frame_rate") or 30.0
+        duration = None
+        for track in timeline_dict.get("tracks") or []:
+            for clip in track.get("clips") or []:
+                end = clip.get("end")
+                if end is None:
+                    continue
+                # Small values are seconds, matching VideoClip.from_dict; frame
+                # counts are in the timeline's rate, as the renderer reads them
+                end_seconds = end if end < 1000 else end / frame_rate
+                if duration is None or end_seconds > duration:
+                    duration = end_seconds
+        return duration
+    except (AttributeError, TypeError):
+        return None
+
+
 async def process_export_job(job_id: str, timeline_dict: Dict[str, Any], 
                            profile_id: str, output_path: str, 
-                           custom_settings: Optional[Dict[str, Any]] = None):
-    """Process an export job asynchronously"""
+                           custom_settings: Optional[Dict[str, Any]] = None,
+                           timeline_duration: Optional[float] = None):
+    """Process an export job asynchronously
+    
+    timeline_duration is the estimate already computed when the job was created;
+    it is only recomputed from timeline_dict when not supplied.
+    """
     try:
         job_manager.update_job_status(job_id, "processing", 0.0)
         
@@ -184,52 +363,54 @@ async def process_export_job(job_id: str, timeline_dict: Dict[str, Any],
         if not profile:
             raise ValueError(f"Export profile not found: {profile_id}")
         
-        # Create timeline from dict
-        timeline = Timeline()
-        timeline.from_dict(timeline_dict)
+        # Create timeline from dict (the only full parse; kept off the event loop)
+        timeline = await asyncio.to_thread(Timeline.from_dict, timeline_dict)
+        if timeline_duration is None:
+            timeline_duration = _fast_duration(timeline_dict)
         
         # Create FFmpeg pipeline
         pipeline = FFMpegPipeline(timeline)
         
-        # Ensure output directory exists
+        # EXPORT_DIR is created when the job starts; only custom subdirectories need creating
         output_dir = os.path.dirname(output_path)
-        if not os.path.exists(output_dir):
-            os.makedirs(output_dir, exist_ok=True)
+        if output_dir != EXPORT_DIR:
+            await asyncio.to_thread(os.makedirs, output_dir, exist_ok=True)
         
         # Apply custom settings if provided
         if custom_settings:
-            # Override profile settings with custom settings
-            for key, value in custom_settings.items():
-                if hasattr(profile, key):
-                    setattr(profile, key, value)
+            # Override on a copy so the shared registry profile stays untouched
+            overrides = {k: v for k, v in custom_settings.items() if k in _PROFILE_FIELDS}
+            profile = replace(profile, **overrides)
         
-        # Update progress
-        job_manager.update_job_status(job_id, "processing", 25.0)
+        # Update progress (no status transition, so skip update_job_status)
+        job_manager.set_progress(job_id, 25.0)
         
         # Generate FFmpeg command using profile
-        if hasattr(pipeline, 'render_export_with_profile'):
+        if _PIPELINE_HAS_PROFILE_EXPORT:
             # Use enhanced method if available
             await pipeline.render_export_with_profile(output_path, profile)
         else:
             # Fallback to existing method with quality mapping
-            quality_map = {
-                "youtube_1080p_h264": "high",
-                "youtube_4k_h264": "high",
-                "web_1080p_h264": "high",
-                "web_720p_h264": "medium",
-                "mobile_720p_h264": "medium",
-                "instagram_feed_1080": "medium",
-                "instagram_story_1080": "medium",
-                "tiktok_1080": "medium"
-            }
-            quality = quality_map.get(profile_id, "high")
+            quality = LEGACY_QUALITY_MAP.get(profile_id, "high")
             
-            # Run in thread to avoid blocking
-            loop = asyncio.get_event_loop()
-            await loop.run_in_executor(None, pipeline.render_export, output_path, quality)
+            # ffmpeg progress fills the 25-90% window between setup and verification.
+            # It is reported from the render thread, so the update is handed to
+            # the loop that owns job_manager
+            loop = asyncio.get_running_loop()
+            
+            def report_progress(fraction: float):
+                loop.call_soon_threadsafe(job_manager.set_progress, job_id, 25.0 + fraction * 65.0)
+            
+            # Render on the dedicated export pool so long encodes can't starve the default executor
+            async with _render_slots:
+                await loop.run_in_executor(_render_executor, partial(
+                    pipeline.render_export, output_path, quality,
+                    progress_callback=report_progress,
+                    duration_seconds=timeline_duration
+                ))
         
         # Final progress update
-        job_manager.update_job_status(job_id, "processing", 90.0)
+        job_manager.set_progress(job_id, 90.0)
         
         # Verify output file exists
         if not os.path.exists(output_path):
@@ -247,70 +428,97 @@ async def process_export_job(job_id: str, timeline_dict: Dict[str, Any],
 
 # ================== API ENDPOINTS ==================
 
-@router.get("/profiles", response_model=List[ExportProfileResponse])
+# Profiles are static after load, so their JSON is serialized once and reused
+_profile_list_json_cache: Dict[Optional[ExportCategory], bytes] = {}
+_profile_json_cache: Dict[str, bytes] = {}
+
+
+def _build_profile_response(profile: ExportProfile) -> ExportProfileResponse:
+    """Build the list-view response for a profile"""
+    # Determine quality estimate
+    quality = "high"
+    if profile.video_crf and profile.video_crf > 25:
+        quality = "medium"
+    elif profile.video_kbps:
+        if profile.video_kbps < 2000:
+            quality = "medium"
+        elif profile.video_kbps > 10000:
+            quality = "very_high"
+    
+    return ExportProfileResponse(
+        id=profile.id,
+        name=profile.name,
+        description=profile.description,
+        category=profile.category.value,
+        container=profile.container,
+        resolution=profile.resolution,
+        framerate=profile.framerate,
+        estimated_quality=quality,
+        platform_optimized=bool(profile.platform_specific),
+        file_size_estimate=f"~{profile.video_bitrate or 'Variable'} video bitrate"
+    )
+
+
+def _get_profile_list_json(category: Optional[ExportCategory] = None) -> bytes:
+    """Get cached profile list JSON, optionally filtered by category"""
+    content = _profile_list_json_cache.get(category)
+    if content is None:
+        if category:
+            profiles = export_profiles_service.get_profiles_by_category(category)
+        else:
+            profiles = export_profiles_service.get_all_profiles()
+        content = dumps([_build_profile_response(p).model_dump() for p in profiles])
+        _profile_list_json_cache[category] = content
+    return content
+
+
+def _get_profile_json(profile: ExportProfile) -> bytes:
+    """Get cached detail JSON for a single profile"""
+    content = _profile_json_cache.get(profile.id)
+    if content is None:
+        content = dumps(ExportProfileResponse(
+            id=profile.id,
+            name=profile.name,
+            description=profile.description,
+            category=profile.category.value,
+            container=profile.container,
+            resolution=profile.resolution,
+            framerate=profile.framerate,
+            estimated_quality="high" if profile.video_bitrate else "variable",
+            platform_optimized=bool(profile.platform_specific)
+        ).model_dump())
+        _profile_json_cache[profile.id] = content
+    return content
+
+
+@router.get("/profiles", responses={200: {"model": List[ExportProfileResponse]}})
 async def get_export_profiles(category: Optional[str] = Query(None, description="Filter by category")):
     """Get all available export profiles"""
     try:
+        cat_enum = None
         if category:
             try:
                 cat_enum = ExportCategory(category.lower())
-                profiles = export_profiles_service.get_profiles_by_category(cat_enum)
             except ValueError:
                 raise HTTPException(status_code=400, detail=f"Invalid category: {category}")
-        else:
-            profiles = export_profiles_service.get_all_profiles()
-        
-        result = []
-        for profile in profiles:
-            # Determine quality estimate
-            quality = "high"
-            if profile.video_crf and profile.video_crf > 25:
-                quality = "medium"
-            elif profile.video_bitrate and "k" in profile.video_bitrate:
-                bitrate = int(profile.video_bitrate.replace("k", ""))
-                if bitrate < 2000:
-                    quality = "medium"
-                elif bitrate > 10000:
-                    quality = "very_high"
-            
-            result.append(ExportProfileResponse(
-                id=profile.id,
-                name=profile.name,
-                description=profile.description,
-                category=profile.category.value,
-                container=profile.container,
-                resolution=profile.resolution,
-                framerate=profile.framerate,
-                estimated_quality=quality,
-                platform_optimized=bool(profile.platform_specific),
-                file_size_estimate=f"~{profile.video_bitrate or 'Variable'} video bitrate"
-            ))
         
-        return result
+        return Response(content=_get_profile_list_json(cat_enum), media_type="application/json")
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error getting export profiles: {e}")
         raise HTTPException(status_code=500, detail="Failed to get export profiles")
 
 
-@router.get("/profiles/{profile_id}", response_model=ExportProfileResponse)
+@router.get("/profiles/{profile_id}", responses={200: {"model": ExportProfileResponse}})
 async def get_export_profile(profile_id: str):
     """Get a specific export profile"""
     profile = export_profiles_service.get_profile(profile_id)
     if not profile:
         raise HTTPException(status_code=404, detail=f"Export profile not found: {profile_id}")
     
-    return ExportProfileResponse(
-        id=profile.id,
-        name=profile.name,
-        description=profile.description,
-        category=profile.category.value,
-        container=profile.container,
-        resolution=profile.resolution,
-        framerate=profile.framerate,
-        estimated_quality="high" if profile.video_bitrate else "variable",
-        platform_optimized=bool(profile.platform_specific)
-    )
+    return Response(content=_get_profile_json(profile), media_type="application/json")
 
 
 @router.post("/professional", response_model=ExportStatusResponse)
@@ -329,21 +537,15 @@ async def export_professional(request: ExportRequest, background_tasks: Backgrou
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"export_{request.profile_id}_{timestamp}.{profile.container}"
         
-        output_dir = "/tmp/exports"
-        os.makedirs(output_dir, exist_ok=True)
-        output_path = os.path.join(output_dir, filename)
+        # Recreated on every export in case a tmp cleaner removed it
+        await asyncio.to_thread(os.makedirs, EXPORT_DIR, exist_ok=True)
+        output_path = os.path.join(EXPORT_DIR, filename)
         
         # Estimate timeline duration for file size estimation
-        timeline_duration = None
-        try:
-            timeline = Timeline()
-            timeline.from_dict(request.timeline)
-            timeline_duration = timeline.get_duration()
-        except:
-            pass
+        timeline_duration = _fast_duration(request.timeline)
         
         # Create export job
-        job_id = job_manager.create_job(request.profile_id, output_path, timeline_duration)
+        job_id, job = job_manager.create_job(profile, output_path, timeline_duration)
         
         # Start export in background
         task = asyncio.create_task(
@@ -352,7 +554,8 @@ async def export_professional(request: ExportRequest, background_tasks: Backgrou
                 request.timeline, 
                 request.profile_id, 
                 output_path,
-                request.custom_settings
+                request.custom_settings,
+                timeline_duration
             )
         )
         job_manager._active_jobs[job_id] = task
@@ -366,7 +569,7 @@ async def export_professional(request: ExportRequest, background_tasks: Backgrou
             data={
                 "profile_name": profile.name,
                 "output_filename": filename,
-                "estimated_size_mb": job_manager.get_job(job_id).estimated_size_mb
+                "estimated_size_mb": job.estimated_size_mb
             }
         )
         
@@ -400,10 +603,10 @@ async def export_quick(request: QuickExportRequest, background_tasks: Background
     return await export_professional(professional_request, background_tasks)
 
 
-@router.get("/jobs", response_model=List[ExportJob])
+@router.get("/jobs", responses={200: {"model": List[ExportJob]}})
 async def get_export_jobs():
     """Get all export jobs"""
-    return job_manager.get_all_jobs()
+    return Response(content=job_manager.get_all_jobs_json(), media_type="application/json")
 
 
 @router.get("/jobs/{job_id}", response_model=ExportJob)
@@ -438,14 +641,19 @@ async def download_export(job_id: str):
     if job.status != "completed":
         raise HTTPException(status_code=400, detail=f"Export not completed. Status: {job.status}")
     
-    if not os.path.exists(job.output_path):
+    # Stat once here and hand it to FileResponse so it doesn't stat again
+    try:
+        stat_result = os.stat(job.output_path)
+    except FileNotFoundError:
         raise HTTPException(status_code=404, detail="Export file not found")
     
     filename = os.path.basename(job.output_path)
+    extension = os.path.splitext(filename)[1].lstrip(".").lower()
     return FileResponse(
         job.output_path,
+        stat_result=stat_result,
         filename=filename,
-        media_type="application/octet-stream"
+        media_type=CONTAINER_MEDIA_TYPES.get(extension, "application/octet-stream")
     )
 
 
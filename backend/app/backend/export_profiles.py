@@ -5,10 +5,38 @@ Provides industry-standard export presets for different platforms, quality level
 and use cases. Supports both FFmpeg and GES rendering pipelines.
 """
 
-from typing import Dict, List, Optional, Union, Any
+from typing import Dict, List, Optional, Tuple, Union, Any
+from collections import defaultdict
 from dataclasses import dataclass
 from enum import Enum
 import os
+import re
+
+
+_BITRATE_RE = re.compile(r'(\d+(?:\.\d+)?)\s*([km]?)', re.IGNORECASE)
+
+
+def _parse_bitrate(bitrate: Optional[str]) -> Optional[int]:
+    """Parse a bitrate string like "8000k" or "2M" into kbps"""
+    if not bitrate:
+        return None
+    match = _BITRATE_RE.match(bitrate.strip())
+    if not match:
+        return None
+    value = float(match.group(1))
+    if match.group(2).lower() == 'm':
+        value *= 1000
+    return int(value)
+
+
+# Rough video MB/s estimates for CRF encodes
+_CRF_TO_MBPS = {
+    0: 50,    # Lossless
+    18: 8,    # High quality
+    23: 4,    # Medium quality
+    28: 2,    # Lower quality
+    32: 1     # Low quality
+}
 
 
 class ExportCategory(Enum):
@@ -78,6 +106,57 @@ class ExportProfile:
     def __post_init__(self):
         if self.platform_specific is None:
             self.platform_specific = {}
+        # Bitrates parsed once so estimates don't re-parse strings per call
+        self.video_kbps: Optional[int] = _parse_bitrate(self.video_bitrate)
+        self.audio_kbps: Optional[int] = _parse_bitrate(self.audio_bitrate)
+        # Codec names resolved from the enums once
+        self._vcodec_str: str = self.video_codec.value
+        self._acodec_str: str = self.audio_codec.value
+        # Lowercased once for search; newline keeps matches from spanning both fields
+        self._search_text: str = f"{self.name}\n{self.description}".lower()
+        # Profile-constant FFmpeg arguments; only input/output vary per export
+        self._arg_template: Tuple[str, ...] = self._build_arg_template()
+    
+    def _build_arg_template(self) -> Tuple[str, ...]:
+        """Build the FFmpeg arguments that sit between the input and output files"""
+        args = []
+        
+        # Video codec and settings
+        args.extend(["-c:v", self._vcodec_str])
+        
+        if self.video_bitrate:
+            args.extend(["-b:v", self.video_bitrate])
+        elif self.video_crf is not None:
+            args.extend(["-crf", str(self.video_crf)])
+        
+        if self.video_preset:
+            args.extend(["-preset", self.video_preset])
+        
+        # Resolution
+        if self.resolution != "original":
+            args.extend(["-s", self.resolution])
+        
+        # Framerate
+        args.extend(["-r", self.framerate])
+        
+        # Audio codec and settings
+        args.extend(["-c:a", self._acodec_str])
+        args.extend(["-b:a", self.audio_bitrate])
+        args.extend(["-ac", str(self.audio_channels)])
+        args.extend(["-ar", str(self.audio_samplerate)])
+        
+        # Color settings
+        if self.color_space:
+            args.extend(["-colorspace", self.color_space])
+        
+        if self.pixel_format:
+            args.extend(["-pix_fmt", self.pixel_format])
+        
+        # Platform-specific optimizations
+        if self.platform_specific.get("fast_start"):
+            args.extend(["-movflags", "+faststart"])
+        
+        return tuple(args)
 
 
 class ProfessionalExportProfiles:
@@ -85,6 +164,7 @@ class ProfessionalExportProfiles:
     
     def __init__(self):
         self._profiles: Dict[str, ExportProfile] = {}
+        self._by_category: Dict[ExportCategory, List[ExportProfile]] = defaultdict(list)
         self._load_default_profiles()
     
     def _load_default_profiles(self):
@@ -260,7 +340,11 @@ class ProfessionalExportProfiles:
     
     def _add_profile(self, profile: ExportProfile):
         """Add a profile to the registry"""
+        previous = self._profiles.get(profile.id)
+        if previous is not None:
+            self._by_category[previous.category].remove(previous)
         self._profiles[profile.id] = profile
+        self._by_category[profile.category].append(profile)
     
     def get_profile(self, profile_id: str) -> Optional[ExportProfile]:
         """Get a specific export profile by ID"""
@@ -268,7 +352,7 @@ class ProfessionalExportProfiles:
     
     def get_profiles_by_category(self, category: ExportCategory) -> List[ExportProfile]:
         """Get all profiles in a specific category"""
-        return [p for p in self._profiles.values() if p.category == category]
+        return list(self._by_category.get(category, ()))
     
     def get_all_profiles(self) -> List[ExportProfile]:
         """Get all available profiles"""
@@ -281,85 +365,32 @@ class ProfessionalExportProfiles:
     def search_profiles(self, query: str) -> List[ExportProfile]:
         """Search profiles by name or description"""
         query_lower = query.lower()
-        return [
-            p for p in self._profiles.values()
-            if query_lower in p.name.lower() or query_lower in p.description.lower()
-        ]
+        return [p for p in self._profiles.values() if query_lower in p._search_text]
     
     def generate_ffmpeg_args(self, profile: ExportProfile, input_file: str, output_file: str) -> List[str]:
         """Generate FFmpeg command arguments for a given profile"""
-        args = ["ffmpeg", "-y", "-i", input_file]
-        
-        # Video codec and settings
-        args.extend(["-c:v", profile.video_codec.value])
+        return ["ffmpeg", "-y", "-i", input_file, *profile._arg_template, output_file]
+    
+    def estimate_file_size(self, profile: ExportProfile, duration_seconds: float) -> Optional[float]:
+        """Estimate output file size in MB based on profile and duration"""
+        if profile.audio_kbps is None:
+            return None
         
-        if profile.video_bitrate:
-            args.extend(["-b:v", profile.video_bitrate])
+        # Video bitrate estimation
+        video_mbps = 0
+        if profile.video_kbps:
+            video_mbps = profile.video_kbps / 8192  # kbps -> MB/s
         elif profile.video_crf is not None:
-            args.extend(["-crf", str(profile.video_crf)])
+            # Rough estimation based on CRF values
+            video_mbps = _CRF_TO_MBPS.get(profile.video_crf, 4)
         
-        if profile.video_preset:
-            args.extend(["-preset", profile.video_preset])
+        # Audio bitrate estimation
+        audio_mbps = profile.audio_kbps / 8192  # kbps -> MB/s
         
-        # Resolution
-        if profile.resolution != "original":
-            args.extend(["-s", profile.resolution])
+        total_mbps = video_mbps + audio_mbps
+        estimated_size_mb = total_mbps * duration_seconds
         
-        # Framerate
-        args.extend(["-r", profile.framerate])
-        
-        # Audio codec and settings
-        args.extend(["-c:a", profile.audio_codec.value])
-        args.extend(["-b:a", profile.audio_bitrate])
-        args.extend(["-ac", str(profile.audio_channels)])
-        args.extend(["-ar", str(profile.audio_samplerate)])
-        
-        # Color settings
-        if profile.color_space:
-            args.extend(["-colorspace", profile.color_space])
-        
-        if profile.pixel_format:
-            args.extend(["-pix_fmt", profile.pixel_format])
-        
-        # Platform-specific optimizations
-        if profile.platform_specific:
-            if profile.platform_specific.get("fast_start"):
-                args.extend(["-movflags", "+faststart"])
-        
-        args.append(output_file)
-        return args
-    
-    def estimate_file_size(self, profile: ExportProfile, duration_seconds: float) -> Optional[float]:
-        """Estimate output file size in MB based on profile and duration"""
-        try:
-            # Video bitrate estimation
-            video_mbps = 0
-            if profile.video_bitrate:
-                # Parse bitrate string like "8000k" or "35000k"
-                bitrate_str = profile.video_bitrate.lower().replace('k', '').replace('m', '000')
-                video_kbps = float(bitrate_str)
-                video_mbps = video_kbps / 8 / 1024  # Convert to MB/s
-            elif profile.video_crf is not None:
-                # Rough estimation based on CRF values
-                crf_to_mbps = {
-                    0: 50,    # Lossless
-                    18: 8,    # High quality
-                    23: 4,    # Medium quality
-                    28: 2,    # Lower quality
-                    32: 1     # Low quality
-                }
-                video_mbps = crf_to_mbps.get(profile.video_crf, 4)
-            
-            # Audio bitrate estimation
-            audio_kbps = float(profile.audio_bitrate.lower().replace('k', ''))
-            audio_mbps = audio_kbps / 8 / 1024  # Convert to MB/s
-            
-            total_mbps = video_mbps + audio_mbps
-            estimated_size_mb = total_mbps * duration_seconds
-            
-            return estimated_size_mb
-        except:
-            return None
+        return estimated_size_mb
 
 
 # Global instance
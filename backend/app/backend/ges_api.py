@@ -1,27 +1,42 @@
-from fastapi import APIRouter, HTTPException, BackgroundTasks
-from pydantic import BaseModel
-from typing import List, Optional, Dict, Any
+from fastapi import APIRouter, Depends, HTTPException, Request, WebSocket, WebSocketDisconnect
+from fastapi.responses import ORJSONResponse, Response
+from pydantic import BaseModel, ConfigDict
+from typing import Callable, List, Literal, NamedTuple, Optional, Dict, Any, Set, Tuple
+import asyncio
+import gc
 import logging
 import os
-import tempfile
-import json
+import re
+import time
+import uuid
+from collections import OrderedDict
 from pathlib import Path
 
+import numpy as np
+
 from .ges_service import (
     get_ges_service, 
     cleanup_ges_service,
+    EXPORT_FORMATS,
+    GESTimelineService,
     TimelineClip,
     TimelineData,
     is_ges_available,
     get_ges_status
 )
+from .serialization import dumps
 
 logger = logging.getLogger(__name__)
+# Bound once for the scrub-rate seek/snap handlers
+_log_info = logger.info
+_log_debug = logger.debug
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 
 # Request/Response Models
 class TimelineClipRequest(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     id: str
     name: str
     start: float  # seconds
@@ -30,8 +45,24 @@ class TimelineClipRequest(BaseModel):
     file_path: str
     type: str
     in_point: float = 0.0  # seconds
+    track: int = 0  # Track/layer index (0=main, 1=overlay, etc.)
+
+    def to_timeline_clip(self) -> TimelineClip:
+        return TimelineClip(
+            id=self.id,
+            name=self.name,
+            start=self.start,
+            end=self.end,
+            duration=self.duration,
+            in_point=self.in_point,
+            file_path=self.file_path,
+            type=self.type,
+            track=self.track
+        )
 
 class CreateTimelineRequest(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     clips: List[TimelineClipRequest]
     frame_rate: float = 30.0
     width: int = 1920
@@ -40,17 +71,157 @@ class CreateTimelineRequest(BaseModel):
     channels: int = 2
 
 class SeekRequest(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     position: float  # seconds
+    client_id: Optional[str] = None  # coalescing key; defaults to the caller's address
+
+ExportFormat = Literal[EXPORT_FORMATS]
 
 class ExportRequest(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     output_path: str
-    format_string: str = "video/x-h264+audio/mpeg"
+    format_string: ExportFormat = "video/x-h264+audio/mpeg"
 
 class GESResponse(BaseModel):
+    """Response envelope for all GES endpoints (used for OpenAPI docs only)"""
     success: bool
     message: str
     data: Optional[Dict[str, Any]] = None
 
+def _ges_response(success: bool, message: str, data: Optional[Dict[str, Any]] = None, status_code: int = 200) -> Response:
+    """Encode a GESResponse-shaped payload directly, skipping model validation and re-serialization"""
+    return Response(
+        content=dumps({"success": success, "message": message, "data": data}),
+        status_code=status_code,
+        media_type="application/json"
+    )
+
+# Short-lived cache for the polled GET endpoints: key -> (expires_at, encoded body)
+AVAILABILITY_CACHE_TTL = 30.0
+STATUS_CACHE_TTL = 1.0
+_response_cache: Dict[str, Tuple[float, bytes]] = {}
+
+def _cached_ges_response(key: str, ttl: float, build: Callable[[], Response]) -> Response:
+    """Return the cached response for key, rebuilding it once the TTL has expired"""
+    now = time.monotonic()
+    entry = _response_cache.get(key)
+    if entry is None or entry[0] <= now:
+        response = build()
+        _response_cache[key] = (now + ttl, response.body)
+        return response
+    return Response(content=entry[1], media_type="application/json")
+
+def _invalidate_cached_responses():
+    """Drop cached availability/status after anything that changes GES state"""
+    _response_cache.clear()
+
+# GES exports run as event-loop tasks, one at a time, so they never hold
+# FastAPI threadpool slots; finished jobs are kept for polling up to a cap
+MAX_PENDING_EXPORTS = 8
+MAX_EXPORT_JOBS = 100
+_export_lock = asyncio.Lock()
+_export_jobs: "OrderedDict[str, asyncio.Task]" = OrderedDict()
+# Rendered fraction per job; None while the job is still queued
+_export_progress: Dict[str, Optional[float]] = {}
+
+def _pending_export_count() -> int:
+    return sum(1 for task in _export_jobs.values() if not task.done())
+
+def _retrieve_export_error(task: asyncio.Task):
+    """Mark a failed export's exception as retrieved; _run_export has already logged it"""
+    if not task.cancelled():
+        task.exception()
+
+def _register_export_job(job_id: str, task: asyncio.Task):
+    """Track an export task, dropping the oldest finished jobs beyond MAX_EXPORT_JOBS"""
+    task.add_done_callback(_retrieve_export_error)
+    _export_jobs[job_id] = task
+    _export_progress[job_id] = None
+    overflow = len(_export_jobs) - MAX_EXPORT_JOBS
+    if overflow > 0:
+        for old_id in [jid for jid, t in _export_jobs.items() if t.done()][:overflow]:
+            del _export_jobs[old_id]
+            _export_progress.pop(old_id, None)
+
+# Fire-and-forget tasks are referenced here until done so they are not garbage collected
+_background_tasks = set()
+
+def _spawn(coro) -> asyncio.Task:
+    task = asyncio.create_task(coro)
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+    return task
+
+# Clients connected to /ges/events. Events carry either an intent
+# (export_requested, seek_requested) or the state GES actually reached
+# (export progress via export_position, seek via current_time).
+_event_subscribers: Set[WebSocket] = set()
+
+async def _publish_event(event: Dict[str, Any]):
+    """Send event to every subscriber, dropping sockets that fail"""
+    subscribers = list(_event_subscribers)
+    results = await asyncio.gather(
+        *(ws.send_json(event) for ws in subscribers), return_exceptions=True
+    )
+    for ws, result in zip(subscribers, results):
+        if isinstance(result, Exception):
+            _event_subscribers.discard(ws)
+
+def _emit_event(event: Dict[str, Any]):
+    """Schedule event for subscribers without blocking the caller"""
+    if _event_subscribers:
+        _spawn(_publish_event(event))
+
+# Scrub seeks are coalesced per client: each request takes a new seek id and
+# only the client's newest target still current after the window is sent to
+# GES. Every seek id ends with a "seek" event: completed, superseded or failed
+SEEK_COALESCE_SECONDS = 0.016
+_seek_counter = 0
+_latest_seeks: Dict[str, int] = {}
+
+async def _apply_seek(client_key: str, seek_id: int, ges_service, position: float):
+    """Seek GES to position unless the same client sent a newer seek during the coalesce window"""
+    await asyncio.sleep(SEEK_COALESCE_SECONDS)
+    if _latest_seeks.get(client_key) != seek_id:
+        _emit_event({"type": "seek", "seek_id": seek_id, "status": "superseded", "position": position})
+        return
+    del _latest_seeks[client_key]
+    
+    try:
+        if await asyncio.to_thread(ges_service.seek_to_position, position):
+            _emit_event({"type": "seek", "seek_id": seek_id, "status": "completed", "current_time": position})
+        else:
+            logger.error(f"Failed to seek to {position}s")
+            _emit_event({"type": "seek", "seek_id": seek_id, "status": "failed", "position": position})
+    except Exception as e:
+        logger.error(f"Error seeking: {e}")
+        _emit_event({"type": "seek", "seek_id": seek_id, "status": "failed", "position": position, "error": str(e)})
+
+async def _run_export(job_id: str, ges_service, output_path: Path, format_string: str) -> bool:
+    """Export task body; waits for earlier exports and returns the GES export result"""
+    def on_progress(fraction: float):
+        _export_progress[job_id] = fraction
+        _emit_event({"type": "export", "job_id": job_id, "status": "running", "export_position": fraction})
+    
+    try:
+        async with _export_lock:
+            on_progress(0.0)
+            success = await ges_service.export_timeline_async(
+                output_path, format_string, progress_callback=on_progress
+            )
+        if success:
+            logger.info("Export completed: %s", output_path)
+        else:
+            logger.error(f"Export failed: {output_path}")
+        _emit_event({"type": "export", "job_id": job_id, "status": "completed" if success else "failed"})
+        return success
+    except Exception as e:
+        logger.error(f"Export error: {e}")
+        _emit_event({"type": "export", "job_id": job_id, "status": "failed", "error": str(e)})
+        raise
+
 def check_ges_availability():
     """Check if GES is available and raise HTTPException if not"""
     if not is_ges_available():
@@ -59,14 +230,64 @@ def check_ges_availability():
             detail="GStreamer Editing Services not available. Install with: ./install_ges.sh (macOS) or apt-get install python3-gi (Ubuntu)"
         )
 
-@router.get("/ges/availability", response_model=GESResponse)
+def ges_dep() -> GESTimelineService:
+    """Dependency resolving the shared GES service, or 503 when GES is unavailable.
+
+    The singleton is looked up per request rather than pinned on app.state
+    because /ges/cleanup replaces it.
+    """
+    check_ges_availability()
+    return get_ges_service()
+
+# Matches the URI schemes clips may use; anything else is treated as a local path
+_URI_SCHEME_RE = re.compile(r"(file|https?|rtsp)://")
+
+def _validate_clip_paths(clips: List[TimelineClipRequest]) -> List[TimelineClip]:
+    """
+    Check that every local clip file exists, raising one 400 listing all missing files.
+    Clips without a file_path are skipped; remote URIs are passed through unchecked.
+    Runs in a worker thread so all the filesystem reads share one threadpool hop.
+    """
+    # Validate everything first so the client sees every missing file at once
+    errors = []
+    for clip in clips:
+        uri = clip.file_path
+        if not uri:
+            logger.warning("Skipping clip %s: empty file_path", clip.name)
+            continue
+        
+        # Basic URI validation without creating GES objects; remote URIs pass unchecked
+        scheme = _URI_SCHEME_RE.match(uri)
+        if scheme is None:
+            file_path = uri
+        elif scheme.group(1) == "file":
+            file_path = uri[scheme.end():]
+        else:
+            continue
+        
+        if not os.path.exists(file_path):
+            logger.error(f"❌ File does not exist: {file_path}")
+            errors.append(f"File not found for {clip.name}: {file_path}")
+    
+    if errors:
+        raise HTTPException(status_code=400, detail="; ".join(errors))
+    
+    # Use the URIs directly - no downloads needed!
+    timeline_clips = [clip.to_timeline_clip() for clip in clips if clip.file_path]
+    logger.info("✅ Validated %d of %d clip URIs", len(timeline_clips), len(clips))
+    return timeline_clips
+
+@router.get("/ges/availability", responses={200: {"model": GESResponse}})
 async def check_availability():
     """
     Check if GES is available on this system
     """
+    return _cached_ges_response("availability", AVAILABILITY_CACHE_TTL, _build_availability_response)
+
+def _build_availability_response() -> Response:
     available = is_ges_available()
     
-    return GESResponse(
+    return _ges_response(
         success=available,
         message="GES is available" if available else "GES is not installed",
         data={
@@ -76,70 +297,19 @@ async def check_availability():
         }
     )
 
-@router.post("/ges/create-timeline", response_model=GESResponse)
-async def create_timeline(request: CreateTimelineRequest):
+@router.post("/ges/create-timeline", responses={200: {"model": GESResponse}})
+async def create_timeline(
+    request: CreateTimelineRequest,
+    ges_service: GESTimelineService = Depends(ges_dep)
+):
     """
     Create a GES timeline from clip data
     """
-    check_ges_availability()
-    
     try:
-        logger.info(f"Creating GES timeline with {len(request.clips)} clips")
-        
-        # Convert request clips to service clips with proper error handling
-        timeline_clips = []
-        for clip in request.clips:
-            try:
-                # Validate the URI format
-                uri = clip.file_path
-                if not uri:
-                    logger.warning(f"Skipping clip {clip.name}: empty file_path")
-                    continue
-                    
-                # Log the URI we're trying to use
-                logger.info(f"Processing clip {clip.name} with URI: {uri}")
-                
-                # Basic URI validation without creating GES objects
-                if is_ges_available():
-                    # Just check if it's a valid file path/URI format
-                    if uri.startswith('file://'):
-                        file_path = uri[7:]  # Remove 'file://' prefix
-                        if not os.path.exists(file_path):
-                            logger.error(f"❌ File does not exist: {file_path}")
-                            raise HTTPException(
-                                status_code=400,
-                                detail=f"File not found for {clip.name}: {file_path}"
-                            )
-                    elif not uri.startswith(('http://', 'https://', 'rtsp://')):
-                        # Assume it's a local file path, check if it exists
-                        if not os.path.exists(uri):
-                            logger.error(f"❌ File does not exist: {uri}")
-                            raise HTTPException(
-                                status_code=400,
-                                detail=f"File not found for {clip.name}: {uri}"
-                            )
-                    
-                    logger.info(f"✅ URI validated for {clip.name}")
-                
-                timeline_clips.append(TimelineClip(
-                    id=clip.id,
-                    name=clip.name,
-                    start=clip.start,
-                    end=clip.end,
-                    duration=clip.duration,
-                    file_path=uri,  # Use the URI directly - no downloads needed!
-                    type=clip.type,
-                    in_point=clip.in_point
-                ))
-                
-            except HTTPException:
-                raise  # Re-raise HTTP exceptions
-            except Exception as e:
-                logger.error(f"Error processing clip {clip.name}: {e}")
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"Error processing clip {clip.name}: {str(e)}"
-                )
+        logger.info("Creating GES timeline with %d clips", len(request.clips))
+        
+        # Validate clip paths off the event loop; the stat calls block
+        timeline_clips = await asyncio.to_thread(_validate_clip_paths, request.clips)
         
         timeline_data = TimelineData(
             clips=timeline_clips,
@@ -150,24 +320,23 @@ async def create_timeline(request: CreateTimelineRequest):
             channels=request.channels
         )
         
-        # Get GES service and create timeline
+        # Create timeline on the GES service
         try:
-            ges_service = get_ges_service()
-            
             # Clean up any existing timeline before creating a new one
             logger.info("Cleaning up existing timeline before creating new one")
             ges_service.cleanup()
             
             success = ges_service.create_timeline_from_data(timeline_data)
+            _invalidate_cached_responses()
             
             if not success:
                 raise HTTPException(status_code=500, detail="Failed to create GES timeline")
             
             duration = ges_service.get_timeline_duration()
                 
-            logger.info(f"✅ Successfully created GES timeline with {len(timeline_clips)} clips, duration: {duration}s")
+            logger.info("✅ Successfully created GES timeline with %d clips, duration: %ss", len(timeline_clips), duration)
             
-            return GESResponse(
+            return _ges_response(
                 success=True,
                 message="Timeline created successfully",
                 data={
@@ -187,176 +356,260 @@ async def create_timeline(request: CreateTimelineRequest):
         raise  # Re-raise HTTP exceptions with proper status codes
     except Exception as e:
         logger.error(f"❌ Unexpected error creating timeline: {e}")
-        raise HTTPException(status_code=500, detail=f"Unexpected error: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Unexpected error: {e}")
 
-@router.post("/ges/start-preview", response_model=GESResponse)
-async def start_preview(port: int = 8554):
+@router.post("/ges/start-preview", responses={200: {"model": GESResponse}})
+def start_preview(port: int = 8554, play: bool = True, ges_service: GESTimelineService = Depends(ges_dep)):
     """
-    Start GES preview server
+    Start GES preview server; play=false leaves it prerolled and paused
     """
-    check_ges_availability()
-    
     try:
-        logger.info(f"Starting GES preview on port {port}")
+        logger.info("Starting GES preview on port %s", port)
         
-        ges_service = get_ges_service()
-        success = ges_service.start_preview_server(port)
+        success = ges_service.start_preview_server(port, play=play)
+        _invalidate_cached_responses()
         
         if not success:
             raise HTTPException(status_code=500, detail="Failed to start preview server")
         
-        return GESResponse(
+        return _ges_response(
             success=True,
             message="Preview server started",
-            data={"port": port}
+            data={"port": port, "playing": play}
         )
         
     except Exception as e:
         logger.error(f"Error starting preview: {e}")
-        raise HTTPException(status_code=500, detail=f"Failed to start preview: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Failed to start preview: {e}")
 
-@router.post("/ges/stop-preview", response_model=GESResponse)
-async def stop_preview():
+@router.post("/ges/stop-preview", responses={200: {"model": GESResponse}})
+def stop_preview(ges_service: GESTimelineService = Depends(ges_dep)):
     """
     Stop GES preview server
     """
-    check_ges_availability()
-    
     try:
         logger.info("Stopping GES preview")
         
-        ges_service = get_ges_service()
         ges_service.stop_preview()
+        _invalidate_cached_responses()
         
-        return GESResponse(
+        return _ges_response(
             success=True,
             message="Preview server stopped"
         )
         
     except Exception as e:
         logger.error(f"Error stopping preview: {e}")
-        raise HTTPException(status_code=500, detail=f"Failed to stop preview: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Failed to stop preview: {e}")
 
-@router.post("/ges/seek", response_model=GESResponse)
-async def seek_to_position(request: SeekRequest):
+@router.post("/ges/play", responses={200: {"model": GESResponse}})
+def play_preview(ges_service: GESTimelineService = Depends(ges_dep)):
     """
-    Seek to a specific position in the timeline
+    Start playback of a preview prerolled with play=false
     """
-    check_ges_availability()
-    
     try:
-        logger.info(f"Seeking to position {request.position}s")
+        logger.info("Starting GES preview playback")
         
-        ges_service = get_ges_service()
-        success = ges_service.seek_to_position(request.position)
+        success = ges_service.start_playback()
+        _invalidate_cached_responses()
         
         if not success:
-            raise HTTPException(status_code=500, detail="Failed to seek")
+            raise HTTPException(status_code=500, detail="Failed to start preview playback")
         
-        return GESResponse(
+        return _ges_response(
             success=True,
-            message=f"Seeked to position {request.position}s"
+            message="Preview playback started"
         )
         
     except Exception as e:
-        logger.error(f"Error seeking: {e}")
-        raise HTTPException(status_code=500, detail=f"Failed to seek: {str(e)}")
+        logger.error(f"Error starting preview playback: {e}")
+        raise HTTPException(status_code=500, detail=f"Failed to start playback: {e}")
 
-@router.post("/ges/export", response_model=GESResponse)
-async def export_timeline(request: ExportRequest, background_tasks: BackgroundTasks):
+@router.post("/ges/seek", status_code=202, responses={202: {"model": GESResponse}})
+async def seek_to_position(
+    request: SeekRequest,
+    http_request: Request,
+    ges_service: GESTimelineService = Depends(ges_dep),
+):
     """
-    Export timeline to video file
+    Seek to a specific position in the timeline.
+    Fails with 500 when there is no preview to seek. Otherwise returns 202
+    with a seek_id; rapid seeks from one client are coalesced so only its
+    latest target reaches GES, and the outcome of each seek_id is reported
+    as a "seek" event on /ges/events.
     """
-    check_ges_availability()
+    global _seek_counter
+    
+    if ges_service.pipeline is None:
+        raise HTTPException(status_code=500, detail="Failed to seek: no preview pipeline")
     
     try:
-        logger.info(f"Starting export to {request.output_path}")
-        
-        # Ensure output directory exists
-        output_dir = os.path.dirname(request.output_path)
-        if not os.path.exists(output_dir):
-            os.makedirs(output_dir, exist_ok=True)
-        
-        ges_service = get_ges_service()
-        
-        # Run export in background task
-        def run_export():
-            try:
-                success = ges_service.export_timeline(
-                    request.output_path, 
-                    request.format_string
-                )
-                if success:
-                    logger.info(f"Export completed: {request.output_path}")
-                else:
-                    logger.error(f"Export failed: {request.output_path}")
-            except Exception as e:
-                logger.error(f"Export error: {e}")
-        
-        background_tasks.add_task(run_export)
-        
-        return GESResponse(
+        _log_info("Seeking to position %ss", request.position)
+        
+        # A browser spreads requests over several connections, so the port
+        # is not part of the default key
+        client_key = request.client_id
+        if client_key is None:
+            client = http_request.client
+            client_key = client.host if client else ""
+        _seek_counter += 1
+        seek_id = _seek_counter
+        _latest_seeks[client_key] = seek_id
+        _spawn(_apply_seek(client_key, seek_id, ges_service, request.position))
+        _emit_event({"type": "seek_requested", "seek_id": seek_id, "position": request.position})
+        
+        return _ges_response(
+            success=True,
+            message=f"Seeking to position {request.position}s",
+            data={"seek_id": seek_id},
+            status_code=202
+        )
+        
+    except Exception as e:
+        logger.error(f"Error seeking: {e}")
+        raise HTTPException(status_code=500, detail=f"Failed to seek: {e}")
+
+@router.post("/ges/export", responses={200: {"model": GESResponse}})
+async def export_timeline(request: ExportRequest, ges_service: GESTimelineService = Depends(ges_dep)):
+    """
+    Export timeline to video file.
+    The export runs as a background task; poll /ges/export/{job_id} for the result.
+    """
+    try:
+        if _pending_export_count() >= MAX_PENDING_EXPORTS:
+            raise HTTPException(status_code=429, detail="Too many exports in progress, try again later")
+        
+        logger.info("Starting export to %s", request.output_path)
+        
+        # Resolve the output path once and ensure its directory exists
+        output_path = Path(request.output_path).absolute()
+        await asyncio.to_thread(output_path.parent.mkdir, parents=True, exist_ok=True)
+        
+        # Run export as a background task driven by the GStreamer bus
+        job_id = uuid.uuid4().hex
+        _register_export_job(job_id, asyncio.create_task(
+            _run_export(job_id, ges_service, output_path, request.format_string)
+        ))
+        _emit_event({"type": "export_requested", "job_id": job_id, "output_path": request.output_path})
+        
+        return _ges_response(
             success=True,
             message="Export started",
             data={
+                "job_id": job_id,
                 "output_path": request.output_path,
                 "format": request.format_string
             }
         )
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error starting export: {e}")
-        raise HTTPException(status_code=500, detail=f"Failed to start export: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Failed to start export: {e}")
 
-@router.get("/ges/status", response_model=GESResponse)
-async def get_status():
+@router.get("/ges/export/{job_id}", responses={200: {"model": GESResponse}})
+async def get_export_job(job_id: str):
     """
-    Get GES service status
+    Get the state of a GES export job started via /ges/export
     """
-    try:
-        # Check status from ges_service module without initializing
-        status_info = get_ges_status()
-        
-        if not status_info.get("available", False):
-            return GESResponse(
-                success=False,
-                message="GES not available",
-                data={
-                    "has_timeline": False,
-                    "is_running": False,
-                    "timeline_duration": 0,
-                    "ges_available": False,
-                    "ges_initialized": False,
-                    "has_imports": status_info.get("has_imports", False)
-                }
-            )
-        
-        # Only get service if GES is available and initialized
-        ges_service = get_ges_service()
-        
-        data = {
-            "has_timeline": ges_service.timeline is not None,
-            "is_running": ges_service.is_running,
-            "timeline_duration": ges_service.get_timeline_duration(),
-            "ges_available": True,
-            "ges_initialized": status_info.get("initialized", False),
-            "has_imports": status_info.get("has_imports", False)
-        }
-        
-        return GESResponse(
+    task = _export_jobs.get(job_id)
+    if task is None:
+        raise HTTPException(status_code=404, detail=f"Export job not found: {job_id}")
+    
+    if not task.done():
+        progress = _export_progress.get(job_id)
+        state = "queued" if progress is None else "running"
+        return _ges_response(
             success=True,
-            message="Status retrieved",
-            data=data
+            message=f"Export {state}",
+            data={"job_id": job_id, "status": state, "progress": progress or 0.0}
         )
+    
+    error = None if task.cancelled() else task.exception()
+    if task.cancelled() or error is not None:
+        return _ges_response(
+            success=False,
+            message=f"Export failed: {error}" if error else "Export cancelled",
+            data={"job_id": job_id, "status": "failed"}
+        )
+    
+    completed = task.result()
+    return _ges_response(
+        success=completed,
+        message="Export completed" if completed else "Export failed",
+        data={"job_id": job_id, "status": "completed" if completed else "failed"}
+    )
+
+@router.websocket("/ges/events")
+async def ges_events(websocket: WebSocket):
+    """
+    Push GES export and seek events to the client instead of having it poll /ges/status
+    """
+    await websocket.accept()
+    _event_subscribers.add(websocket)
+    try:
+        while True:
+            # Incoming messages are ignored; receiving just detects disconnects
+            await websocket.receive_text()
+    except WebSocketDisconnect:
+        pass
+    finally:
+        _event_subscribers.discard(websocket)
+
+@router.get("/ges/status", responses={200: {"model": GESResponse}})
+def get_status():
+    """
+    Get GES service status
+    """
+    try:
+        return _cached_ges_response("status", STATUS_CACHE_TTL, _build_status_response)
         
     except Exception as e:
         logger.error(f"Error getting status: {e}")
-        raise HTTPException(status_code=500, detail=f"Failed to get status: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Failed to get status: {e}")
+
+def _build_status_response() -> Response:
+    # Check status from ges_service module without initializing
+    status_info = get_ges_status()
+    
+    if not status_info.get("available", False):
+        return _ges_response(
+            success=False,
+            message="GES not available",
+            data={
+                "has_timeline": False,
+                "is_running": False,
+                "timeline_duration": 0,
+                "ges_available": False,
+                "ges_initialized": False,
+                "has_imports": status_info.get("has_imports", False)
+            }
+        )
+    
+    # Only get service if GES is available and initialized
+    ges_service = get_ges_service()
+    
+    data = {
+        "has_timeline": ges_service.timeline is not None,
+        "is_running": ges_service.is_running,
+        "timeline_duration": ges_service.get_timeline_duration(),
+        "ges_available": True,
+        "ges_initialized": status_info.get("initialized", False),
+        "has_imports": status_info.get("has_imports", False)
+    }
+    
+    return _ges_response(
+        success=True,
+        message="Status retrieved",
+        data=data
+    )
 
-@router.post("/ges/cleanup", response_model=GESResponse)
-async def cleanup():
+@router.post("/ges/cleanup", responses={200: {"model": GESResponse}})
+def cleanup(force_gc: bool = False):
     """
-    Clean up GES resources and force memory cleanup
+    Clean up GES resources.
+    Only the young GC generation is collected unless force_gc requests a full collection.
     """
     try:
         logger.info("🧹 Starting comprehensive GES cleanup...")
@@ -364,28 +617,31 @@ async def cleanup():
         # Get current status before cleanup
         try:
             status_before = get_ges_status()
-            logger.info(f"Status before cleanup: initialized={status_before.get('initialized', False)}, available={status_before.get('available', False)}")
+            logger.info("Status before cleanup: initialized=%s, available=%s", status_before.get('initialized', False), status_before.get('available', False))
         except:
             logger.info("Could not get status before cleanup")
         
         # Always cleanup regardless of initialization state
         # Don't call is_ges_available() as it would initialize GStreamer just to clean it up
         cleanup_ges_service()
+        _invalidate_cached_responses()
         
-        # Force garbage collection after cleanup
-        import gc
-        gc.collect()
+        # GES frees its C-level memory itself; a full stop-the-world collection is opt-in
+        if force_gc:
+            gc.collect()
+        else:
+            gc.collect(0)
         
         # Get status after cleanup
         try:
             status_after = get_ges_status()
-            logger.info(f"Status after cleanup: initialized={status_after.get('initialized', False)}, available={status_after.get('available', False)}")
+            logger.info("Status after cleanup: initialized=%s, available=%s", status_after.get('initialized', False), status_after.get('available', False))
         except:
             logger.info("Could not get status after cleanup")
         
         logger.info("✅ GES cleanup completed successfully")
         
-        return GESResponse(
+        return _ges_response(
             success=True,
             message="GES resources cleaned up successfully",
             data={
@@ -396,163 +652,217 @@ async def cleanup():
         
     except Exception as e:
         logger.error(f"❌ Error during GES cleanup: {e}")
-        raise HTTPException(status_code=500, detail=f"Failed to cleanup: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Failed to cleanup: {e}")
 
 # Command API mappings for common NLP intents
-@router.post("/ges/commands/cut-clip", response_model=GESResponse)
-async def cut_clip(clip_id: str, cut_position: float):
-    """
-    Cut a clip at the specified position
-    NLP Intent: "cut dead space" / "split clip at 30 seconds"
-    """
+def _run_command(intent: str, handler: Callable[..., Response], *args) -> Response:
+    """Run a GES editing command handler with the route's validated arguments"""
     check_ges_availability()
     
     try:
-        # This would require extending the GES service to support clip editing
-        # For now, return a placeholder response
-        return GESResponse(
-            success=False,
-            message="Clip cutting not yet implemented in GES service"
-        )
+        return handler(*args)
         
     except Exception as e:
-        logger.error(f"Error cutting clip: {e}")
-        raise HTTPException(status_code=500, detail=f"Failed to cut clip: {str(e)}")
+        logger.error(f"Error running GES command {intent}: {e}")
+        raise HTTPException(status_code=500, detail=f"Failed to run {intent}: {e}")
+
+def _cut_clip_command(clip_id: str, cut_position: float) -> Response:
+    # This would require extending the GES service to support clip editing
+    # For now, return a placeholder response
+    return _ges_response(
+        success=False,
+        message="Clip cutting not yet implemented in GES service"
+    )
+
+def _move_clip_command(clip_id: str, new_start_time: float) -> Response:
+    # This would require extending the GES service to support clip repositioning
+    # For now, return a placeholder response
+    return _ges_response(
+        success=False,
+        message="Clip moving not yet implemented in GES service"
+    )
 
-@router.post("/ges/commands/move-clip", response_model=GESResponse)
+def _add_text_command(text: str, start_time: float, duration: float) -> Response:
+    # This would add a text clip to the timeline
+    # For now, return a placeholder response
+    return _ges_response(
+        success=False,
+        message="Text overlay addition not yet implemented in GES service"
+    )
+
+@router.post("/ges/commands/cut-clip", responses={200: {"model": GESResponse}})
+async def cut_clip(clip_id: str, cut_position: float):
+    """
+    Cut a clip at the specified position
+    NLP Intent: "cut dead space" / "split clip at 30 seconds"
+    """
+    return _run_command("cut-clip", _cut_clip_command, clip_id, cut_position)
+
+@router.post("/ges/commands/move-clip", responses={200: {"model": GESResponse}})
 async def move_clip(clip_id: str, new_start_time: float):
     """
     Move a clip to a new position
     NLP Intent: "move clip to 0:30"
     """
-    check_ges_availability()
-    
-    try:
-        # This would require extending the GES service to support clip repositioning
-        # For now, return a placeholder response
-        return GESResponse(
-            success=False,
-            message="Clip moving not yet implemented in GES service"
-        )
-        
-    except Exception as e:
-        logger.error(f"Error moving clip: {e}")
-        raise HTTPException(status_code=500, detail=f"Failed to move clip: {str(e)}")
+    return _run_command("move-clip", _move_clip_command, clip_id, new_start_time)
 
-@router.post("/ges/commands/add-text", response_model=GESResponse)
+@router.post("/ges/commands/add-text", responses={200: {"model": GESResponse}})
 async def add_text_overlay(text: str, start_time: float, duration: float):
     """
     Add text overlay to timeline
     NLP Intent: "add text overlay"
     """
-    check_ges_availability()
+    return _run_command("add-text", _add_text_command, text, start_time, duration)
+
+# Number of snap points echoed back in all_snap_points
+SNAP_POINTS_PREVIEW = 20
+
+def _smallest_unique(points: np.ndarray, count: int) -> np.ndarray:
+    """The count smallest distinct values of points, sorted, without sorting all of points"""
+    k = count
+    while k < points.size:
+        smallest = np.unique(np.partition(points, k - 1)[:k])
+        if smallest.size >= count:
+            return smallest[:count]
+        k *= 2
+    return np.unique(points)[:count]
+
+class _SnapGeometry(NamedTuple):
+    starts: np.ndarray
+    ends: np.ndarray
+    midpoints: np.ndarray
+    points: np.ndarray  # candidate snap points, unsorted
+    timeline_end: float
+    track_starts: np.ndarray  # sorted starts on the insertion track
+    preview: List[float]  # all_snap_points
+
+# Drag updates resend the same clips with a new target, so the geometry is
+# memoized per (clips, track_filter, include_timeline_markers)
+MAX_SNAP_CACHE_ENTRIES = 64
+_snap_cache: "OrderedDict[tuple, _SnapGeometry]" = OrderedDict()
+
+def _snap_geometry(clips: List[TimelineClipRequest], track_filter: Optional[int], include_markers: bool) -> _SnapGeometry:
+    """Snap point arrays for a non-empty clip list, cached across requests"""
+    key = (tuple(clips), track_filter, include_markers)
+    geometry = _snap_cache.get(key)
+    if geometry is not None:
+        _snap_cache.move_to_end(key)
+        return geometry
     
-    try:
-        # This would add a text clip to the timeline
-        # For now, return a placeholder response
-        return GESResponse(
-            success=False,
-            message="Text overlay addition not yet implemented in GES service"
-        )
-        
-    except Exception as e:
-        logger.error(f"Error adding text overlay: {e}")
-        raise HTTPException(status_code=500, detail=f"Failed to add text overlay: {str(e)}")
+    # One pass over the clips; snap types are classified against all clips
+    clip_table = np.array(
+        [(clip.start, clip.end, clip.duration, clip.track) for clip in clips],
+        dtype=np.float64
+    )
+    starts, ends, tracks = clip_table[:, 0], clip_table[:, 1], clip_table[:, 3]
+    midpoints = starts + clip_table[:, 2] / 2
+    timeline_end = float(ends.max())
+    
+    # Skip clips on different tracks if track filter is specified
+    if track_filter is not None:
+        on_track = tracks == track_filter
+        candidates = [starts[on_track], ends[on_track], midpoints[on_track]]
+    else:
+        candidates = [starts, ends, midpoints]
+    
+    # Add timeline markers if requested
+    if include_markers:
+        candidates.append(np.array([0.0, timeline_end]))
+    
+    points = np.concatenate(candidates)
+    geometry = _SnapGeometry(
+        starts=starts,
+        ends=ends,
+        midpoints=midpoints,
+        points=points,
+        timeline_end=timeline_end,
+        track_starts=np.sort(starts[tracks == (track_filter or 0)]),
+        preview=_smallest_unique(points, SNAP_POINTS_PREVIEW).tolist()
+    )
+    
+    _snap_cache[key] = geometry
+    if len(_snap_cache) > MAX_SNAP_CACHE_ENTRIES:
+        _snap_cache.popitem(last=False)
+    return geometry
 
 class SnapRequest(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     target_position: float
     clips: List[TimelineClipRequest] 
     track_filter: Optional[int] = None  # Optional: only snap to clips on specific track
     snap_threshold: float = 2.0  # Snap distance threshold in seconds
     include_timeline_markers: bool = True  # Include 0.0 and timeline end
 
-@router.post("/ges/snap-to-clips", response_model=GESResponse)
+@router.post("/ges/snap-to-clips", responses={200: {"model": GESResponse}})
 async def snap_position_to_clips(request: SnapRequest):
     """
     Calculate optimal snap position for timeline clips during drag operations.
     Provides enhanced snapping logic for professional video editing workflow.
     """
     try:
-        logger.info(f"Calculating snap position for {request.target_position}s with {len(request.clips)} clips")
+        _log_info("Calculating snap position for %ss with %d clips", request.target_position, len(request.clips))
+        
+        target = request.target_position
+        
+        # Empty timeline (e.g. the first drag): only the timeline start can be a snap point
+        if not request.clips:
+            snapped = request.include_timeline_markers and abs(target) <= request.snap_threshold
+            return _ges_response(
+                success=True,
+                message="Position snapped to timeline_start" if snapped else "No snap applied",
+                data={
+                    "original_position": target,
+                    "snapped_position": 0.0 if snapped else target,
+                    "snap_distance": abs(target) if snapped else 0.0,
+                    "snapped": snapped,
+                    "snap_type": "timeline_start" if snapped else "none",
+                    "insertion_index": 0,
+                    "all_snap_points": [0.0] if request.include_timeline_markers else [],
+                    "snap_threshold": request.snap_threshold
+                }
+            )
         
-        # Collect all snap points from clips
-        snap_points = []
+        # Everything but the target is reused across the frames of one drag
+        geometry = _snap_geometry(request.clips, request.track_filter, request.include_timeline_markers)
+        starts, ends, midpoints, points = geometry.starts, geometry.ends, geometry.midpoints, geometry.points
         
-        # Add timeline markers if requested
-        if request.include_timeline_markers:
-            snap_points.append(0.0)  # Timeline start
+        # Find the closest snap point within threshold (none can qualify below zero);
+        # ties go to the smaller position
+        snap_distance = None
+        if points.size and request.snap_threshold >= 0:
+            distances = np.abs(points - target)
+            snap_distance = float(distances.min())
         
-        # Process clips to find snap points
-        for clip in request.clips:
-            # Skip clips on different tracks if track filter is specified
-            if request.track_filter is not None and hasattr(clip, 'track') and getattr(clip, 'track', 0) != request.track_filter:
-                continue
-                
-            # Add clip boundaries as snap points
-            snap_points.append(clip.start)  # Clip start
-            snap_points.append(clip.end)    # Clip end
-            
-            # Add clip midpoint for fine positioning
-            midpoint = clip.start + (clip.duration / 2)
-            snap_points.append(midpoint)
-        
-        # Add timeline end if we have clips
-        if request.clips and request.include_timeline_markers:
-            timeline_end = max(clip.end for clip in request.clips)
-            snap_points.append(timeline_end)
-        
-        # Remove duplicates and sort
-        snap_points = sorted(set(snap_points))
-        
-        # Find the best snap point within threshold
-        eligible_points = [
-            point for point in snap_points 
-            if abs(point - request.target_position) <= request.snap_threshold
-        ]
-        
-        if eligible_points:
-            # Find the closest point within threshold
-            nearest_point = min(eligible_points, key=lambda x: abs(x - request.target_position))
-            snap_distance = abs(nearest_point - request.target_position)
+        if snap_distance is not None and snap_distance <= request.snap_threshold:
+            nearest_point = float(points[distances == snap_distance].min())
             snapped = True
             
-            # Determine snap type for better UX feedback
+            # Determine snap type for better UX feedback: first clip whose
+            # start, end or center matches, checked in that order per clip
             snap_type = "unknown"
-            for clip in request.clips:
-                if abs(nearest_point - clip.start) < 0.01:
-                    snap_type = "clip_start"
-                    break
-                elif abs(nearest_point - clip.end) < 0.01:
-                    snap_type = "clip_end"
-                    break
-                elif abs(nearest_point - (clip.start + clip.duration / 2)) < 0.01:
-                    snap_type = "clip_center"
-                    break
+            at_start = np.abs(starts - nearest_point) < 0.01
+            at_end = np.abs(ends - nearest_point) < 0.01
+            at_center = np.abs(midpoints - nearest_point) < 0.01
+            matches = at_start | at_end | at_center
+            if matches.any():
+                first = int(matches.argmax())
+                snap_type = "clip_start" if at_start[first] else "clip_end" if at_end[first] else "clip_center"
             
             if nearest_point == 0.0:
                 snap_type = "timeline_start"
-            elif request.clips and nearest_point == max(clip.end for clip in request.clips):
+            elif nearest_point == geometry.timeline_end:
                 snap_type = "timeline_end"
                 
         else:
             # No snap point within threshold - return original position
-            nearest_point = request.target_position
+            nearest_point = target
             snap_distance = 0.0
             snapped = False
             snap_type = "none"
         
         # Calculate insertion index for clip reordering
-        target_track = request.track_filter or 0
-        track_clips = [clip for clip in request.clips if getattr(clip, 'track', 0) == target_track]
-        sorted_clips = sorted(track_clips, key=lambda c: c.start)
-        
-        insertion_index = 0
-        for i, clip in enumerate(sorted_clips):
-            if nearest_point < clip.start:
-                insertion_index = i
-                break
-            elif i == len(sorted_clips) - 1:
-                insertion_index = len(sorted_clips)
+        insertion_index = int(np.searchsorted(geometry.track_starts, nearest_point, side="right"))
                 
         result_data = {
             "original_position": request.target_position,
@@ -561,13 +871,13 @@ async def snap_position_to_clips(request: SnapRequest):
             "snapped": snapped,
             "snap_type": snap_type,
             "insertion_index": insertion_index,
-            "all_snap_points": snap_points[:20],  # Limit for performance
+            "all_snap_points": geometry.preview,
             "snap_threshold": request.snap_threshold
         }
         
-        logger.debug(f"Snap calculation: {request.target_position}s → {nearest_point}s ({snap_type})")
+        _log_debug("Snap calculation: %ss → %ss (%s)", request.target_position, nearest_point, snap_type)
         
-        return GESResponse(
+        return _ges_response(
             success=True,
             message=f"Position snapped to {snap_type}" if snapped else "No snap applied",
             data=result_data
@@ -575,4 +885,4 @@ async def snap_position_to_clips(request: SnapRequest):
         
     except Exception as e:
         logger.error(f"Error calculating snap position: {e}")
-        raise HTTPException(status_code=500, detail=f"Failed to calculate snap: {str(e)}") 
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=f"Failed to calculate snap: {e}") 
\ No newline at end of file
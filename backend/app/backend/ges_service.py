@@ -16,7 +16,7 @@ else:
         gi.require_version('Gst', '1.0')
         gi.require_version('GES', '1.0')
 
-        from gi.repository import Gst, GES, GLib
+        from gi.repository import Gst, GES
         
         # DON'T initialize GStreamer at import time - use lazy initialization
         GES_IMPORTS_AVAILABLE = True
@@ -52,6 +52,7 @@ else:
             self.layers = []
             self.tracks = [MockTrack("VIDEO"), MockTrack("AUDIO")]
             self._clips = []  # Track clips for duration calculation
+            self._max_end = None  # Latest clip end, kept up to date by add_clip_data
         def append_layer(self):
             layer = MockLayer()
             self.layers.append(layer)
@@ -69,16 +70,20 @@ else:
         def add_clip_data(self, clip_data):
             """Add clip data for duration calculation"""
             self._clips.append(clip_data)
+            if self._max_end is None or clip_data.end > self._max_end:
+                self._max_end = clip_data.end
         def get_duration(self):
             """Calculate timeline duration from clips"""
-            if not self._clips:
+            if self._max_end is None:
                 return 0
             # Return duration in nanoseconds (GStreamer format)
-            max_end = max(clip.end for clip in self._clips)
-            return int(max_end * 1000000000)  # Convert to nanoseconds
+            return int(self._max_end * 1000000000)  # Convert to nanoseconds
         def commit(self):
             """Mock commit method"""
             pass
+        def commit_sync(self):
+            """Mock commit_sync method"""
+            return True
     
     class MockCaps:
         @staticmethod
@@ -146,32 +151,60 @@ else:
         class TrackType:
             VIDEO = "VIDEO"
             AUDIO = "AUDIO"
-    
-    class GLib:
-        class MainLoop:
-            pass
 
 import threading
 import logging
 import asyncio
+import math
 import json
-from typing import List, Dict, Optional, Any
+from typing import Callable, List, Dict, Optional, Any, Tuple, Union
 from dataclasses import dataclass
+from functools import lru_cache
 import os
+import subprocess
 import tempfile
+import numpy as np
+import time
+import weakref
+from collections import OrderedDict
 from pathlib import Path
+from urllib.parse import unquote, urlparse
 
 logger = logging.getLogger(__name__)
 
-# GStreamer initialization state
+GES_USING_STUBS = False  # Will be set based on import success
+
+# Nanoseconds per second (Gst.SECOND), kept as a plain int so time
+# conversions skip the GI attribute lookup
+_NS: int = 1_000_000_000
+
+# Bus poll slice for async exports (nanoseconds)
+EXPORT_POLL_INTERVAL_NS = 100_000_000
+
+# Export timeout budget: EXPORT_TIMEOUT_FACTOR x the timeline duration, but
+# never less than EXPORT_MIN_TIMEOUT_SECONDS
+EXPORT_MIN_TIMEOUT_SECONDS = 60.0
+EXPORT_TIMEOUT_FACTOR = 3.0
+
+# Preview latency tuning: the default audio sink buffers ~200ms, so the sink
+# ring buffer is shrunk (microseconds) and pipeline latency pinned (nanoseconds)
+PREVIEW_AUDIO_SINK_PROPERTIES = {"buffer-time": 20000, "latency-time": 10000}
+PREVIEW_LATENCY_NS = 50_000_000
+
+# Upper bound on preview preroll in PAUSED before start (nanoseconds)
+PREVIEW_PREROLL_TIMEOUT_NS = 10_000_000_000
+
+# Poll slice for the preview bus watcher thread (nanoseconds)
+PREVIEW_BUS_POLL_NS = 100_000_000
+
+# Only a successful initialization is remembered; a failed one is retried
 GES_INITIALIZED = False
 GES_INIT_LOCK = threading.Lock()
-GES_USING_STUBS = False  # Will be set based on import success
 
 def _initialize_ges() -> bool:
     """
     Lazy initialization of GStreamer. 
-    Only initializes once, thread-safe.
+    Only initializes once, thread-safe; a failure is retried on the next call.
     Returns True if successful, False otherwise.
     """
     global GES_INITIALIZED
@@ -202,7 +235,7 @@ def _initialize_ges() -> bool:
             logger.error(f"❌ Failed to initialize GStreamer: {e}")
             return False
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TimelineClip:
     id: str
     name: str
@@ -214,7 +247,7 @@ class TimelineClip:
     type: str = "video"  # video, audio, text
     track: int = 0  # Track/layer index (0=main, 1=overlay, etc.)
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TimelineData:
     clips: List[TimelineClip]
     frame_rate: float = 30.0
@@ -223,6 +256,41 @@ class TimelineData:
     sample_rate: int = 48000
     channels: int = 2
 
+@dataclass(slots=True)
+class TimelineDataSoA:
+    """Column layout of a clip list, used internally for vectorized timeline builds"""
+    starts: np.ndarray
+    durations: np.ndarray
+    in_points: np.ndarray
+    tracks: np.ndarray
+    types: List[str]
+    paths: List[str]
+    
+    @classmethod
+    def from_clips(cls, clips: List[TimelineClip]) -> 'TimelineDataSoA':
+        columns = np.array(
+            [(clip.start, clip.duration, clip.in_point, clip.track) for clip in clips], dtype=np.float64
+        ).reshape(-1, 4)
+        return cls(
+            starts=columns[:, 0],
+            durations=columns[:, 1],
+            in_points=columns[:, 2],
+            tracks=columns[:, 3].astype(np.int64),
+            types=[clip.type for clip in clips],
+            paths=[clip.file_path for clip in clips]
+        )
+    
+    def timings_ns(self, order: np.ndarray) -> np.ndarray:
+        """
+        (start, duration, inpoint) nanoseconds per clip in order. Rows holding a
+        non-finite or out-of-range value are set to -1 before the int64 cast,
+        whose result for those values differs between platforms.
+        """
+        scaled = np.stack([self.starts[order], self.durations[order], self.in_points[order]], axis=1) * _NS
+        representable = (np.isfinite(scaled) & (np.abs(scaled) < 2.0 ** 63)).all(axis=1)
+        scaled[~representable] = -1
+        return scaled.astype(np.int64)
+
 def convert_videoclip_to_timeline_clip(video_clip, timeline) -> TimelineClip:
     """
     Convert a VideoClip to a GES-compatible TimelineClip.
@@ -232,13 +300,19 @@ def convert_videoclip_to_timeline_clip(video_clip, timeline) -> TimelineClip:
     Returns:
         TimelineClip: GES-compatible timeline clip
     """
+    return _timeline_clip_from_frames(video_clip, 1.0 / timeline.frame_rate)
+
+def _timeline_clip_from_frames(video_clip, inv_fr: float) -> TimelineClip:
+    """Build a TimelineClip from a VideoClip's frame positions, given 1 / frame rate"""
+    start = video_clip.start * inv_fr
+    end = video_clip.end * inv_fr
     return TimelineClip(
         id=video_clip.clip_id,
         name=video_clip.name,
-        start=video_clip.get_timeline_start_seconds(timeline),
-        end=video_clip.get_timeline_end_seconds(timeline),
-        duration=video_clip.get_duration_seconds(timeline),
-        in_point=video_clip.get_source_in_point_seconds(timeline),
+        start=start,
+        end=end,
+        duration=end - start,
+        in_point=getattr(video_clip, 'in_point', 0) * inv_fr,
         file_path=video_clip.file_path or "",
         type=video_clip.track_type,
         track=getattr(video_clip, 'track_index', 0)
@@ -256,16 +330,19 @@ def convert_timeline_clip_to_videoclip(timeline_clip: TimelineClip, timeline) ->
     # Import here to avoid circular imports
     from ..timeline import VideoClip
     
-    return VideoClip(
+    fr = timeline.frame_rate
+    video_clip = VideoClip(
         name=timeline_clip.name,
-        start_frame=int(timeline_clip.start * timeline.frame_rate),
-        end_frame=int(timeline_clip.end * timeline.frame_rate),
+        start_frame=int(timeline_clip.start * fr),
+        end_frame=int(timeline_clip.end * fr),
         track_type=timeline_clip.type,
         file_path=timeline_clip.file_path,
-        clip_id=timeline_clip.id,
-        in_point=int(timeline_clip.in_point * timeline.frame_rate),
-        track_index=timeline_clip.track
+        clip_id=timeline_clip.id
     )
+    # VideoClip has no constructor arguments for these; convert_videoclip_to_timeline_clip reads them back
+    video_clip.in_point = int(timeline_clip.in_point * fr)
+    video_clip.track_index = timeline_clip.track
+    return video_clip
 
 def create_timeline_data_from_clips(video_clips: List, timeline, width: int = 1920, height: int = 1080) -> TimelineData:
     """
@@ -278,10 +355,8 @@ def create_timeline_data_from_clips(video_clips: List, timeline, width: int = 19
     Returns:
         TimelineData: GES-compatible timeline data
     """
-    timeline_clips = [
-        convert_videoclip_to_timeline_clip(clip, timeline)
-        for clip in video_clips
-    ]
+    inv_fr = 1.0 / timeline.frame_rate
+    timeline_clips = [_timeline_clip_from_frames(clip, inv_fr) for clip in video_clips]
     
     return TimelineData(
         clips=timeline_clips,
@@ -292,6 +367,309 @@ def create_timeline_data_from_clips(video_clips: List, timeline, width: int = 19
         channels=2
     )
 
+# Encoding profiles accepted by export; validated at the API layer so bad
+# strings never reach GStreamer
+EXPORT_FORMATS = (
+    "video/x-h264+audio/mpeg",
+    "video/x-h264+audio/aac",
+    "video/x-h265+audio/mpeg",
+    "video/x-vp9+audio/x-opus",
+)
+
+# Stream-copy export fast path: when every clip already matches the requested
+# encoding and the timeline caps, clips are concatenated with ffmpeg -c copy
+# instead of re-encoded. Opt-in: -c copy can only cut on keyframes, so in/out
+# points are not frame-accurate the way the GES render is. Enable with
+# GES_EXPORT_STREAM_COPY=1
+EXPORT_STREAM_COPY = os.getenv("GES_EXPORT_STREAM_COPY", "").lower() in ("1", "true", "yes")
+MAX_PROBE_CACHE_ENTRIES = 256
+
+# Encoding-profile caps -> ffprobe codec names they accept
+_CAPS_TO_CODECS = {
+    "video/x-h264": {"h264"},
+    "video/x-h265": {"hevc"},
+    "video/x-vp8": {"vp8"},
+    "video/x-vp9": {"vp9"},
+    "audio/mpeg": {"aac", "mp3"},
+    "audio/aac": {"aac"},
+    "audio/x-opus": {"opus"},
+    "audio/x-vorbis": {"vorbis"},
+}
+
+# (path, mtime) -> probed stream info, oldest first
+_probe_cache: "OrderedDict[tuple, Optional[Dict[str, Any]]]" = OrderedDict()
+
+def _target_codecs(format_string: str) -> Dict[str, set]:
+    """Map an encoding profile string to the accepted video/audio codec names"""
+    targets = {}
+    for caps in format_string.replace("+", ":").split(":"):
+        media_type = caps.split(",", 1)[0].strip()
+        codecs = _CAPS_TO_CODECS.get(media_type)
+        if codecs:
+            targets[media_type.split("/", 1)[0]] = codecs
+    return targets
+
+def _local_clip_path(uri: str) -> Optional[str]:
+    """Return the filesystem path for a file:// URI or plain path, None for remote URIs"""
+    if uri.startswith("file://"):
+        return unquote(urlparse(uri).path)
+    if "://" in uri:
+        return None
+    return uri
+
+def _probe_streams(path: str) -> Optional[Dict[str, Any]]:
+    """Probe the first video/audio stream of path, cached by path and mtime"""
+    try:
+        key = (path, os.stat(path).st_mtime)
+    except OSError:
+        return None
+    
+    if key in _probe_cache:
+        _probe_cache.move_to_end(key)
+        return _probe_cache[key]
+    
+    info = None
+    try:
+        result = subprocess.run(
+            ["ffprobe", "-v", "error", "-show_entries",
+             "stream=codec_type,codec_name,width,height,r_frame_rate,sample_rate,channels",
+             "-of", "json", path],
+            capture_output=True, text=True, check=True
+        )
+        info = {"video": None, "audio": None}
+        for stream in json.loads(result.stdout).get("streams", []):
+            codec_type = stream.get("codec_type")
+            if codec_type in info and info[codec_type] is None:
+                info[codec_type] = stream.get("codec_name")
+                if codec_type == "video":
+                    info["size"] = (stream.get("width"), stream.get("height"))
+                    num, _, den = stream.get("r_frame_rate", "0/1").partition("/")
+                    den = float(den or 1)
+                    info["fps"] = float(num) / den if den else 0.0
+                else:
+                    info["audio_format"] = (int(stream.get("sample_rate") or 0), stream.get("channels"))
+    except Exception as e:
+        logger.warning(f"ffprobe failed for {path}: {e}")
+    
+    _probe_cache[key] = info
+    if len(_probe_cache) > MAX_PROBE_CACHE_ENTRIES:
+        _probe_cache.popitem(last=False)
+    return info
+
+# Parsed caps and encoding profiles, shared by every timeline build and export.
+# Sealed Gst.Caps are immutable and set_restriction_caps takes its own ref, so
+# the same object can be handed to every track. The templates are only
+# formatted on a cache miss.
+VIDEO_CAPS_FMT = "video/x-raw,width=%d,height=%d,framerate=%d/1"
+AUDIO_CAPS_FMT = "audio/x-raw,rate=%d,channels=%d"
+
+@lru_cache(maxsize=32)
+def _video_caps(width: int, height: int, fps: int) -> Any:
+    return Gst.Caps.from_string(VIDEO_CAPS_FMT % (width, height, fps))
+
+@lru_cache(maxsize=32)
+def _audio_caps(rate: int, channels: int) -> Any:
+    return Gst.Caps.from_string(AUDIO_CAPS_FMT % (rate, channels))
+
+# Hardware encoders per video format, in order of preference. When one is
+# installed, export routes that stream through it instead of the software encoder.
+EXPORT_HW_ENCODING = True
+_HW_ENCODERS = {
+    "video/x-h264": ("vah264enc", "vaapih264enc", "nvh264enc"),
+    "video/x-h265": ("vah265enc", "vaapih265enc", "nvh265enc"),
+}
+
+@lru_cache(maxsize=None)
+def _hw_encoder(media_type: str) -> Optional[str]:
+    """Name of the first installed hardware encoder for media_type, if any"""
+    for name in _HW_ENCODERS.get(media_type, ()):
+        if Gst.ElementFactory.find(name) is not None:
+            return name
+    return None
+
+def _use_hw_encoders(profile: Any):
+    """Point each video stream of an encoding profile at an installed hardware encoder"""
+    streams = profile.get_profiles() if hasattr(profile, "get_profiles") else [profile]
+    for stream in streams:
+        caps = stream.get_format()
+        if caps is None or caps.get_size() == 0:
+            continue
+        encoder = _hw_encoder(caps.get_structure(0).get_name())
+        if encoder:
+            # encodebin uses the preset name to pick the encoder element
+            stream.set_preset_name(encoder)
+            logger.info("Export will encode %s with %s", caps.get_structure(0).get_name(), encoder)
+
+@lru_cache(maxsize=32)
+def _encoding_profile(format_string: str) -> Any:
+    profile = Gst.EncodingProfile.from_string(format_string)
+    if profile and EXPORT_HW_ENCODING:
+        _use_hw_encoders(profile)
+    return profile
+
+def _clear_gst_caches():
+    """Drop every cached GStreamer object (used when GStreamer is torn down)"""
+    _asset_cache.clear()
+    _video_caps.cache_clear()
+    _audio_caps.cache_clear()
+    _encoding_profile.cache_clear()
+    _hw_encoder.cache_clear()
+
+# Discovered UriClipAssets reused across create-timeline calls, keyed by
+# (uri, local file mtime or None for remote URIs), oldest first
+MAX_ASSET_CACHE_ENTRIES = 256
+_asset_cache: "OrderedDict[tuple, Any]" = OrderedDict()
+_asset_cache_lock = threading.Lock()
+
+# UriClipAsset.request_sync is not documented as thread-safe, so discovery is
+# serialized; cache hits only take _asset_cache_lock
+_asset_discovery_lock = threading.Lock()
+
+# Existence checks are shared by clips cut from the same source; the time
+# bucket bounds how long a stale answer can survive
+PATH_EXISTS_TTL_SECONDS = 5
+
+@lru_cache(maxsize=1024)
+def _path_exists_cached(path: str, time_bucket: int) -> bool:
+    return os.path.exists(path)
+
+# Clip paths with one of these prefixes are already URIs
+_URI_PREFIXES = ('http://', 'https://', 'rtsp://', 'file://')
+
+# Local path -> file:// URI. The backend never changes its working directory,
+# so relative paths resolve the same way for the life of the process.
+@lru_cache(maxsize=4096)
+def _to_file_uri(path: str) -> str:
+    return f"file://{os.path.abspath(path)}"
+
+def _clip_uri(file_path: str) -> Optional[str]:
+    """Return the GES URI for a clip path, None for a local file that does not exist"""
+    if file_path.startswith(_URI_PREFIXES):
+        # Already a valid URI (HTTP/HTTPS/RTSP/file)
+        return file_path
+    # Assume it's a local file path, convert to file:// URI
+    file_uri = _to_file_uri(file_path)
+    if not _path_exists_cached(file_uri[len("file://"):], int(time.monotonic() // PATH_EXISTS_TTL_SECONDS)):
+        return None
+    return file_uri
+
+def _get_uri_clip_asset(file_uri: str) -> Any:
+    """Return the UriClipAsset for file_uri, running GES discovery only on a cache miss"""
+    path = _local_clip_path(file_uri)
+    try:
+        mtime = os.stat(path).st_mtime if path else None
+    except OSError:
+        mtime = None
+    key = (file_uri, mtime)
+    
+    with _asset_cache_lock:
+        asset = _asset_cache.get(key)
+        if asset is not None:
+            _asset_cache.move_to_end(key)
+            return asset
+    
+    with _asset_discovery_lock:
+        asset = GES.UriClipAsset.request_sync(file_uri)
+    if asset is not None:
+        with _asset_cache_lock:
+            _asset_cache[key] = asset
+            if len(_asset_cache) > MAX_ASSET_CACHE_ENTRIES:
+                _asset_cache.popitem(last=False)
+    return asset
+
+def _discover_clip_assets(clips: List[TimelineClip]) -> Dict[str, Any]:
+    """Discover each distinct media source of clips once, keyed by URI"""
+    uris = set()
+    for clip in clips:
+        if clip.type in ('video', 'audio') and clip.file_path:
+            uri = _clip_uri(clip.file_path)
+            if uri:
+                uris.add(uri)
+    if not uris:
+        return {}
+    
+    def discover(uri: str) -> Any:
+        try:
+            return _get_uri_clip_asset(uri)
+        except Exception as e:
+            logger.warning(f"Asset discovery failed for {uri}: {e}")
+            return None
+    
+    return {uri: discover(uri) for uri in uris}
+
+def _tune_sink_properties(sink: Any, properties: Dict[str, int]):
+    """
+    Set properties on a sink that supports them. Auto sinks are bins that pick
+    the real sink when they start, so the properties are applied to that child.
+    """
+    def apply(element: Any):
+        for name, value in properties.items():
+            if element.find_property(name) is not None:
+                element.set_property(name, value)
+    
+    if isinstance(sink, Gst.Bin):
+        # GstChildProxy::child-added passes (proxy, child, name)
+        sink.connect("child-added", lambda _proxy, child, _name: apply(child))
+    else:
+        apply(sink)
+
+def _release_service_resources(state: Dict[str, Any]):
+    """
+    Finalizer for a collected GESTimelineService: stop the bus watcher and take
+    its pipelines to NULL. Works on the instance state, never the instance.
+    """
+    stop = state.get("_bus_watch_stop")
+    if stop is not None:
+        stop.set()
+    for name in ("pipeline", "_export_pipeline"):
+        pipeline = state.get(name)
+        if pipeline is not None:
+            try:
+                pipeline.set_state(Gst.State.NULL)
+            except Exception as e:
+                logger.debug("Error releasing pipeline: %s", e)
+
+def _uri_clip_params(clip_data: TimelineClip, timing: Optional[Tuple[int, int, int]] = None) -> Optional[Tuple[str, int, int, int]]:
+    """
+    Validate a media clip and return (uri, start_ns, duration_ns, inpoint_ns),
+    or None (after logging why) if it cannot be added. Never raises.
+    """
+    if not clip_data.file_path:
+        logger.error(f"No file path provided for clip {clip_data.name}")
+        return None
+    
+    if not clip_data.duration > 0:
+        logger.error(f"Invalid duration {clip_data.duration} for clip {clip_data.name}")
+        return None
+    
+    if timing is not None:
+        start_ns, duration_ns, inpoint_ns = timing
+    elif math.isfinite(clip_data.start) and math.isfinite(clip_data.duration) and math.isfinite(clip_data.in_point):
+        start_ns = int(clip_data.start * _NS)
+        duration_ns = int(clip_data.duration * _NS)
+        inpoint_ns = int(clip_data.in_point * _NS)
+    else:
+        start_ns = duration_ns = inpoint_ns = -1
+    
+    if start_ns < 0 or duration_ns <= 0 or inpoint_ns < 0:
+        logger.error(f"Invalid timing values for clip {clip_data.name}: start={start_ns}, duration={duration_ns}, inpoint={inpoint_ns}")
+        return None
+    
+    file_uri = _clip_uri(clip_data.file_path)
+    if file_uri is None:
+        logger.error(f"File does not exist: {os.path.abspath(clip_data.file_path)}")
+        return None
+    
+    return file_uri, start_ns, duration_ns, inpoint_ns
+
+# Child properties shared by every text overlay clip
+_TITLE_STYLE_PROPERTIES = (
+    ("font-desc", "Sans Bold 24"),
+    ("color", 0xFFFFFFFF),  # White text
+    ("halignment", 1),  # Center alignment
+    ("valignment", 2),  # Bottom alignment
+)
+
 class GESTimelineService:
     """
     GStreamer Editing Services timeline management service.
@@ -300,26 +678,29 @@ class GESTimelineService:
     
     def __init__(self):
         self.timeline: Optional[Any] = None
-        self.pipeline: Optional[Any] = None
-        self.main_loop: Optional[Any] = None
-        self.loop_thread: Optional[threading.Thread] = None
+        self.pipeline: Optional[Any] = None  # preview pipeline, reused while the timeline is unchanged
+        self._export_pipeline: Optional[Any] = None  # render pipeline, reused the same way
         self.is_running = False
         self.preview_port = 8554  # RTSP port for preview
         self.timeline_data: Optional[TimelineData] = None  # Store timeline data for duration calculation
+        self._timeline_committed = False  # set once the built timeline has been committed
+        self._ges_ok = False  # GStreamer initialized; cached after the first successful check
+        self._bus_watch_thread: Optional[threading.Thread] = None
+        self._bus_watch_stop: Optional[threading.Event] = None
+    
+        # Runs when the service is collected, but not at interpreter exit where
+        # Gst may already be torn down. It only sees the instance __dict__.
+        self._finalizer = weakref.finalize(self, _release_service_resources, self.__dict__)
+        self._finalizer.atexit = False
     
-    def __del__(self):
-        """Destructor to ensure cleanup when service is garbage collected"""
-        try:
-            self.cleanup()
-        except:
-            # Ignore errors during destruction
-            pass
-        
     def _check_ges_available(self) -> bool:
         """Check if GES is available and initialize if needed"""
+        if self._ges_ok:
+            return True
         if not _initialize_ges():
             logger.error("GStreamer Editing Services not available. Install with ./install_ges.sh")
             return False
+        self._ges_ok = True
         return True
         
     def create_timeline_from_data(self, timeline_data: TimelineData) -> bool:
@@ -330,56 +711,89 @@ class GESTimelineService:
             return False
             
         try:
-            logger.info(f"Creating GES timeline with {len(timeline_data.clips)} clips")
+            logger.info("Creating GES timeline with %d clips", len(timeline_data.clips))
             
             # Store timeline data for duration calculation and other operations
             self.timeline_data = timeline_data
             
-            # Create timeline with audio and video tracks
+            # Create timeline with audio and video tracks. No pipeline is attached
+            # until preview/export, so clip insertion below is not propagated
+            # and the whole build is committed once at the end.
             self.timeline = GES.Timeline.new_audio_video()
+            self._timeline_committed = False
             
             # Set timeline properties
             self._configure_timeline_tracks(timeline_data)
             
+            # Extract clip fields into columns once; the sort, layer count,
+            # timings and validation below all read from them
+            columns = TimelineDataSoA.from_clips(timeline_data.clips)
+            
             # Create layers dynamically based on track indices
             layers = {}
-            max_track = max((clip.track for clip in timeline_data.clips), default=1)
+            max_track = int(columns.tracks.max()) if columns.tracks.size else 1
             
             for track_index in range(max_track + 1):
                 layer = self.timeline.append_layer()
                 layer.set_priority(track_index)  # Lower track index = higher priority (bottom layer)
                 layers[track_index] = layer
-                logger.info(f"Created layer for track {track_index} with priority {track_index}")
+                logger.info("Created layer for track %d with priority %d", track_index, track_index)
+            default_layer = layers.get(0)
+            
+            # Sort by start time (stable, so clips starting together keep their order)
+            order = np.argsort(columns.starts, kind="stable")
+            sorted_clips = [timeline_data.clips[i] for i in order.tolist()]
+            
+            # (start, duration, inpoint) in nanoseconds for every clip in one pass;
+            # rows with non-finite values come out as -1 and are rejected below
+            timing_ns = columns.timings_ns(order)
+            timings = timing_ns.tolist()
+            
+            # Clips with unusable timing, and media clips with no source, are
+            # rejected before discovery
+            timed = (timing_ns >= 0).all(axis=1)
+            is_media = np.array([columns.types[i] in ('video', 'audio') for i in order.tolist()], dtype=bool)
+            has_source = np.array([bool(columns.paths[i]) for i in order.tolist()], dtype=bool)
+            media_valid = (
+                (timing_ns[:, 0] >= 0) & (timing_ns[:, 1] > 0) & (timing_ns[:, 2] >= 0)
+                & (columns.durations[order] > 0) & has_source
+            )
+            rejected = (~timed | (is_media & ~media_valid)).tolist()
             
-            # Sort clips by start time
-            sorted_clips = sorted(timeline_data.clips, key=lambda c: c.start)
+            # Probe every distinct source up front instead of one clip at a time
+            assets = {} if GES_USING_STUBS else _discover_clip_assets(
+                [clip for clip, bad in zip(sorted_clips, rejected) if not bad]
+            )
             
             # Add clips to their respective layers with enhanced error handling
             successful_clips = 0
             failed_clips = 0
             
-            for clip_data in sorted_clips:
+            for clip_data, timing, bad in zip(sorted_clips, timings, rejected):
                 # Get the appropriate layer for this clip's track
-                target_layer = layers.get(clip_data.track, layers.get(0))
+                target_layer = layers.get(clip_data.track, default_layer)
                 
-                if clip_data.type in ['video', 'audio']:
-                    success = self._add_uri_clip_to_layer(target_layer, clip_data)
+                if bad:
+                    failed_clips += 1
+                    logger.error(f"❌ Invalid source or timing for {clip_data.type} clip: {clip_data.name} (start={clip_data.start}, duration={clip_data.duration}, in_point={clip_data.in_point})")
+                elif clip_data.type in ['video', 'audio']:
+                    success = self._add_uri_clip_to_layer(target_layer, clip_data, assets, timing)
                     if success:
                         successful_clips += 1
-                        logger.info(f"✅ Successfully added {clip_data.type} clip: {clip_data.name} to track {clip_data.track}")
+                        logger.info("✅ Successfully added %s clip: %s to track %s", clip_data.type, clip_data.name, clip_data.track)
                     else:
                         failed_clips += 1
                         logger.error(f"❌ Failed to add {clip_data.type} clip: {clip_data.name} to track {clip_data.track}")
                 elif clip_data.type == 'text':
-                    success = self._add_text_clip_to_layer(target_layer, clip_data)
+                    success = self._add_text_clip_to_layer(target_layer, clip_data, timing)
                     if success:
                         successful_clips += 1
-                        logger.info(f"✅ Successfully added text clip: {clip_data.name} to track {clip_data.track}")
+                        logger.info("✅ Successfully added text clip: %s to track %s", clip_data.name, clip_data.track)
                     else:
                         failed_clips += 1
                         logger.error(f"❌ Failed to add text clip: {clip_data.name} to track {clip_data.track}")
             
-            logger.info(f"GES timeline creation summary: {successful_clips} successful, {failed_clips} failed")
+            logger.info("GES timeline creation summary: %d successful, %d failed", successful_clips, failed_clips)
             
             # Return False if more than half the clips failed
             if failed_clips > successful_clips:
@@ -391,12 +805,13 @@ class GESTimelineService:
                 for clip_data in sorted_clips:
                     self.timeline.add_clip_data(clip_data)
             
-            # Commit timeline changes to update duration
+            # Commit the whole build once to update duration
             try:
-                self.timeline.commit()
+                self.timeline.commit_sync()
+                self._timeline_committed = True
                 logger.info("Timeline changes committed")
             except Exception as e:
-                logger.debug(f"Timeline commit failed (might be normal): {e}")
+                logger.debug("Timeline commit failed (might be normal): %s", e)
             
             logger.info("GES timeline created successfully")
             return True
@@ -405,11 +820,14 @@ class GESTimelineService:
             logger.error(f"Error creating GES timeline: {e}")
             return False
     
+    def _commit_timeline(self):
+        """Commit the timeline if create_timeline_from_data has not already done so"""
+        if not self._timeline_committed:
+            self.timeline.commit_sync()
+            self._timeline_committed = True
+    
     def _configure_timeline_tracks(self, timeline_data: TimelineData):
-        """Configure video and audio tracks with specific caps"""
-        if not self._check_ges_available():
-            return
-            
+        """Configure video and audio tracks with specific caps (caller checks GES availability)"""
         try:
             tracks = self.timeline.get_tracks()
             
@@ -418,79 +836,56 @@ class GESTimelineService:
                 
                 if track_type == GES.TrackType.VIDEO:
                     # Set video track restrictions
-                    video_caps = Gst.Caps.from_string(
-                        f"video/x-raw,width={timeline_data.width},"
-                        f"height={timeline_data.height},"
-                        f"framerate={int(timeline_data.frame_rate)}/1"
-                    )
-                    track.set_restriction_caps(video_caps)
+                    track.set_restriction_caps(_video_caps(
+                        timeline_data.width, timeline_data.height, int(timeline_data.frame_rate)
+                    ))
                     track.set_mixing(True)  # Enable transitions
                     
                 elif track_type == GES.TrackType.AUDIO:
                     # Set audio track restrictions  
-                    audio_caps = Gst.Caps.from_string(
-                        f"audio/x-raw,rate={timeline_data.sample_rate},"
-                        f"channels={timeline_data.channels}"
-                    )
-                    track.set_restriction_caps(audio_caps)
+                    track.set_restriction_caps(_audio_caps(timeline_data.sample_rate, timeline_data.channels))
                     track.set_mixing(True)  # Enable audio mixing
                     
         except Exception as e:
             logger.error(f"Error configuring timeline tracks: {e}")
     
-    def _add_uri_clip_to_layer(self, layer: Any, clip_data: TimelineClip) -> bool:
-        """Add a URI clip (video/audio) to the specified layer"""
-        if not self._check_ges_available():
-            return False
-        
+    def _add_uri_clip_to_layer(
+        self,
+        layer: Any,
+        clip_data: TimelineClip,
+        assets: Optional[Dict[str, Any]] = None,
+        timing: Optional[Tuple[int, int, int]] = None
+    ) -> bool:
+        """
+        Add a URI clip (video/audio) to the specified layer, using pre-discovered
+        assets and precomputed (start, duration, inpoint) nanoseconds when given.
+        The caller checks GES availability.
+        """
         # If using stub classes, always return success for testing purposes
         if GES_USING_STUBS:
-            logger.info(f"Mock: Added URI clip {clip_data.name} (stub mode)")
+            logger.info("Mock: Added URI clip %s (stub mode)", clip_data.name)
             return True
-            
+        
+        params = _uri_clip_params(clip_data, timing)
+        if params is None:
+            return False
+        file_uri, start_ns, duration_ns, inpoint_ns = params
+        
+        logger.info("Adding URI clip: %s at %ss (duration: %ss)", clip_data.name, clip_data.start, clip_data.duration)
+        logger.debug("URI: %s", file_uri)
+        
+        # Only the GES calls can raise
         try:
-            # Validate clip data
-            if not clip_data.file_path:
-                logger.error(f"No file path provided for clip {clip_data.name}")
-                return False
-                
-            if clip_data.duration <= 0:
-                logger.error(f"Invalid duration {clip_data.duration} for clip {clip_data.name}")
-                return False
-                
-            # Handle different URI types properly
-            if clip_data.file_path.startswith(('http://', 'https://', 'rtsp://', 'file://')):
-                # Already a valid URI (HTTP/HTTPS/RTSP/file)
-                file_uri = clip_data.file_path
-                logger.info(f"Using URI directly: {file_uri}")
+            # Create URI clip from the (cached) discovered asset
+            if assets is not None and file_uri in assets:
+                asset = assets[file_uri]
             else:
-                # Assume it's a local file path, convert to file:// URI
-                file_path = os.path.abspath(clip_data.file_path)
-                # Check if file exists
-                if not os.path.exists(file_path):
-                    logger.error(f"File does not exist: {file_path}")
-                    return False
-                file_uri = f"file://{file_path}"
-                logger.info(f"Converted local path to URI: {file_uri}")
-                
-            logger.info(f"Adding URI clip: {clip_data.name} at {clip_data.start}s (duration: {clip_data.duration}s)")
-            logger.debug(f"URI: {file_uri}")
-            
-            # Create URI clip
-            clip = GES.UriClip.new(file_uri)
+                asset = _get_uri_clip_asset(file_uri)
+            clip = asset.extract() if asset else None
             if not clip:
                 logger.error(f"Failed to create URI clip for {file_uri}")
                 return False
             
-            # Validate timing values
-            start_ns = int(clip_data.start * Gst.SECOND)
-            duration_ns = int(clip_data.duration * Gst.SECOND)
-            inpoint_ns = int(clip_data.in_point * Gst.SECOND)
-            
-            if start_ns < 0 or duration_ns <= 0 or inpoint_ns < 0:
-                logger.error(f"Invalid timing values for clip {clip_data.name}: start={start_ns}, duration={duration_ns}, inpoint={inpoint_ns}")
-                return False
-            
             # Set timing properties (GES uses nanoseconds)
             clip.set_start(start_ns)
             clip.set_duration(duration_ns)
@@ -498,26 +893,24 @@ class GESTimelineService:
             
             # Add to layer
             layer.add_clip(clip)
-            logger.info(f"✅ Added clip {clip_data.name} successfully (start: {clip_data.start}s, duration: {clip_data.duration}s)")
-            return True
             
         except Exception as e:
             logger.error(f"Error adding URI clip {clip_data.name}: {e}")
-            logger.debug(f"Clip data: start={clip_data.start}, duration={clip_data.duration}, file_path={clip_data.file_path}")
-            return False
-    
-    def _add_text_clip_to_layer(self, layer: Any, clip_data: TimelineClip) -> bool:
-        """Add a text overlay clip to the specified layer"""
-        if not self._check_ges_available():
+            logger.debug("Clip data: start=%s, duration=%s, file_path=%s", clip_data.start, clip_data.duration, clip_data.file_path)
             return False
         
+        logger.info("✅ Added clip %s successfully (start: %ss, duration: %ss)", clip_data.name, clip_data.start, clip_data.duration)
+        return True
+    
+    def _add_text_clip_to_layer(self, layer: Any, clip_data: TimelineClip, timing: Optional[Tuple[int, int, int]] = None) -> bool:
+        """Add a text overlay clip to the specified layer (caller checks GES availability)"""
         # If using stub classes, always return success for testing purposes
         if GES_USING_STUBS:
-            logger.info(f"Mock: Added text clip {clip_data.name} (stub mode)")
+            logger.info("Mock: Added text clip %s (stub mode)", clip_data.name)
             return True
             
         try:
-            logger.info(f"Adding text clip: {clip_data.name} at {clip_data.start}s")
+            logger.info("Adding text clip: %s at %ss", clip_data.name, clip_data.start)
             
             # Create title clip for text overlay
             clip = GES.TitleClip.new()
@@ -527,27 +920,31 @@ class GESTimelineService:
             
             # Set text properties
             clip.set_child_property("text", clip_data.name)
-            clip.set_child_property("font-desc", "Sans Bold 24")
-            clip.set_child_property("color", 0xFFFFFFFF)  # White text
-            clip.set_child_property("halignment", 1)  # Center alignment
-            clip.set_child_property("valignment", 2)  # Bottom alignment
+            for name, value in _TITLE_STYLE_PROPERTIES:
+                clip.set_child_property(name, value)
             
             # Set timing properties
-            clip.set_start(int(clip_data.start * Gst.SECOND))
-            clip.set_duration(int(clip_data.duration * Gst.SECOND))
+            if timing is not None:
+                clip.set_start(timing[0])
+                clip.set_duration(timing[1])
+            else:
+                clip.set_start(int(clip_data.start * _NS))
+                clip.set_duration(int(clip_data.duration * _NS))
             
             # Add to layer
             layer.add_clip(clip)
-            logger.info(f"✅ Added text clip {clip_data.name} successfully")
+            logger.info("✅ Added text clip %s successfully", clip_data.name)
             return True
             
         except Exception as e:
             logger.error(f"Error adding text clip {clip_data.name}: {e}")
             return False
     
-    def start_preview_server(self, port: int = 8554) -> bool:
+    def start_preview_server(self, port: int = 8554, play: bool = True) -> bool:
         """
-        Start an RTSP preview server for the timeline
+        Start an RTSP preview server for the timeline. The pipeline is
+        prerolled in PAUSED so the first frame is ready; with play=False it
+        stays there until start_playback() is called.
         """
         if not self._check_ges_available():
             return False
@@ -557,45 +954,68 @@ class GESTimelineService:
                 logger.error("No timeline available for preview")
                 return False
             
-            # Create pipeline for preview
-            self.pipeline = GES.Pipeline()
-            self.pipeline.set_timeline(self.timeline)
-            
-            # Configure for RTSP streaming preview
-            self._setup_rtsp_preview(port)
+            # Reuse the preview pipeline unless the timeline was rebuilt
+            if not self._pipeline_has_timeline(self.pipeline):
+                self._release_pipeline(self.pipeline)
+                self.pipeline = None
+                self.pipeline = self._pipeline_for_timeline()
+                if self.pipeline is None:
+                    return False
+                
+                # Configure for RTSP streaming preview
+                self._setup_rtsp_preview(port)
+            else:
+                self.pipeline.set_state(Gst.State.NULL)
             
-            # Commit timeline changes
-            self.timeline.commit()
+            # Commit timeline changes unless the build already did
+            self._commit_timeline()
             
-            # Setup bus for messages
-            bus = self.pipeline.get_bus()
-            bus.add_signal_watch()
-            bus.connect("message", self._on_bus_message)
+            # Watch the bus for the message types we handle
+            self._start_bus_watch(self.pipeline.get_bus())
             
             # Set to preview mode
             self.pipeline.set_mode(GES.PipelineFlags.PREVIEW)
+            self.pipeline.set_latency(PREVIEW_LATENCY_NS)
             
-            # Start the pipeline
-            ret = self.pipeline.set_state(Gst.State.PLAYING)
+            # Preroll: decoders and sinks are set up before playback is requested
+            ret = self.pipeline.set_state(Gst.State.PAUSED)
+            if ret != Gst.StateChangeReturn.FAILURE:
+                ret, _state, _pending = self.pipeline.get_state(PREVIEW_PREROLL_TIMEOUT_NS)
             if ret == Gst.StateChangeReturn.FAILURE:
-                logger.error("Failed to start preview pipeline")
+                logger.error("Failed to preroll preview pipeline")
                 return False
             
-            # Start GLib main loop in a separate thread
-            self._start_main_loop()
+            # The bus watcher started above handles messages; no GLib main loop is needed
+            self.is_running = True
+            
+            if play and not self.start_playback():
+                return False
             
-            logger.info(f"Preview server started on RTSP port {port}")
+            logger.info("Preview server started on RTSP port %s", port)
             return True
             
         except Exception as e:
             logger.error(f"Error starting preview server: {e}")
             return False
     
+    def start_playback(self) -> bool:
+        """Switch a prerolled preview pipeline to PLAYING"""
+        if not self.pipeline:
+            logger.error("No preview pipeline to play")
+            return False
+        
+        try:
+            ret = self.pipeline.set_state(Gst.State.PLAYING)
+            if ret == Gst.StateChangeReturn.FAILURE:
+                logger.error("Failed to start preview pipeline")
+                return False
+            return True
+        except Exception as e:
+            logger.error(f"Error starting preview playback: {e}")
+            return False
+    
     def _setup_rtsp_preview(self, port: int):
-        """Setup RTSP streaming for preview"""
-        if not self._check_ges_available():
-            return
-            
+        """Setup RTSP streaming for preview (caller checks GES availability)"""
         try:
             # For now, we'll use a simple preview sink
             # In production, you'd want to set up an RTSP server
@@ -605,44 +1025,55 @@ class GESTimelineService:
             
             audio_sink = Gst.ElementFactory.make("autoaudiosink", None) 
             if audio_sink:
+                _tune_sink_properties(audio_sink, PREVIEW_AUDIO_SINK_PROPERTIES)
                 self.pipeline.preview_set_audio_sink(audio_sink)
                 
         except Exception as e:
             logger.error(f"Error setting up RTSP preview: {e}")
     
-    def _start_main_loop(self):
-        """Start GLib main loop in a separate thread"""
-        if not self._check_ges_available():
-            return
-            
-        def run_loop():
-            self.main_loop = GLib.MainLoop()
-            self.is_running = True
-            logger.info("Starting GStreamer main loop")
-            self.main_loop.run()
-            
-        self.loop_thread = threading.Thread(target=run_loop, daemon=True)
-        self.loop_thread.start()
+    def _start_bus_watch(self, bus: Any):
+        """
+        Pop preview bus messages on a worker thread. Only EOS/ERROR/WARNING are
+        requested, so state-change chatter never crosses into Python.
+        """
+        self._stop_bus_watch()
+        stop = threading.Event()
+        on_message = self._on_bus_message  # keep the thread from holding the service
+        message_types = Gst.MessageType.EOS | Gst.MessageType.ERROR | Gst.MessageType.WARNING
+        
+        def watch():
+            while not stop.is_set():
+                message = bus.timed_pop_filtered(PREVIEW_BUS_POLL_NS, message_types)
+                if message is not None:
+                    on_message(message)
+        
+        self._bus_watch_stop = stop
+        self._bus_watch_thread = threading.Thread(target=watch, daemon=True)
+        self._bus_watch_thread.start()
+    
+    def _stop_bus_watch(self):
+        """Stop the preview bus watcher thread, if one is running"""
+        if self._bus_watch_stop is not None:
+            self._bus_watch_stop.set()
+            self._bus_watch_stop = None
+        if self._bus_watch_thread is not None:
+            if self._bus_watch_thread.is_alive():
+                self._bus_watch_thread.join(timeout=1.0)
+            self._bus_watch_thread = None
     
-    def _on_bus_message(self, bus, message):
+    @staticmethod
+    def _on_bus_message(message):
         """Handle GStreamer bus messages"""
-        if not self._check_ges_available():
-            return
-            
         try:
             if message.type == Gst.MessageType.EOS:
                 logger.info("End of stream reached")
             elif message.type == Gst.MessageType.ERROR:
                 err, debug = message.parse_error()
                 logger.error(f"GStreamer error: {err.message}")
-                logger.debug(f"Debug info: {debug}")
+                logger.debug("Debug info: %s", debug)
             elif message.type == Gst.MessageType.WARNING:
                 warn, debug = message.parse_warning()
                 logger.warning(f"GStreamer warning: {warn.message}")
-            elif message.type == Gst.MessageType.STATE_CHANGED:
-                if message.src == self.pipeline:
-                    old_state, new_state, pending_state = message.parse_state_changed()
-                    logger.info(f"Pipeline state changed: {old_state.value_name} -> {new_state.value_name}")
                     
         except Exception as e:
             logger.error(f"Error handling bus message: {e}")
@@ -653,99 +1084,288 @@ class GESTimelineService:
             return
             
         try:
+            self._stop_bus_watch()
+            
             if self.pipeline:
                 self.pipeline.set_state(Gst.State.NULL)
                 # Note: Don't unref pipeline here as it's reused, only in cleanup()
                 
-            if self.main_loop and self.is_running:
-                self.main_loop.quit()
-                self.is_running = False
-                
-            if self.loop_thread and self.loop_thread.is_alive():
-                self.loop_thread.join(timeout=5.0)
-                
+            self.is_running = False
             logger.info("Preview server stopped")
             
         except Exception as e:
             logger.error(f"Error stopping preview: {e}")
     
-    def export_timeline(self, output_path: str, format_string: str = "video/x-h264+audio/mpeg") -> bool:
+    def _export_timeout(self) -> float:
+        """Seconds an export of the current timeline may take before it is abandoned"""
+        return max(EXPORT_MIN_TIMEOUT_SECONDS, EXPORT_TIMEOUT_FACTOR * self.get_timeline_duration())
+    
+    def _pipeline_has_timeline(self, pipeline: Optional[Any]) -> bool:
+        """Whether pipeline exists and is bound to the current timeline"""
+        return pipeline is not None and pipeline.props.timeline is self.timeline
+    
+    def _release_pipeline(self, pipeline: Optional[Any]):
+        """Take a pooled pipeline down to NULL before it is dropped"""
+        if pipeline is not None:
+            try:
+                pipeline.set_state(Gst.State.NULL)
+            except Exception as e:
+                logger.debug("Error releasing pipeline: %s", e)
+    
+    def _detach_timeline(self, pipeline: Any):
+        """Unparent the current timeline from a stopped pipeline that is being dropped"""
+        try:
+            pipeline.remove(self.timeline)
+        except Exception as e:
+            logger.debug("Error detaching timeline: %s", e)
+    
+    def _pipeline_for_timeline(self) -> Optional[Any]:
+        """
+        A new GES.Pipeline bound to the current timeline, or None if binding
+        fails. The timeline can only have one parent, so whichever pooled
+        pipeline still holds it is released first; taking it from the preview
+        pipeline stops the preview.
+        """
+        if self._pipeline_has_timeline(self.pipeline):
+            self.stop_preview()
+            self._detach_timeline(self.pipeline)
+            self.pipeline = None
+        if self._pipeline_has_timeline(self._export_pipeline):
+            self._release_pipeline(self._export_pipeline)
+            self._detach_timeline(self._export_pipeline)
+            self._export_pipeline = None
+        
+        pipeline = GES.Pipeline()
+        if not pipeline.set_timeline(self.timeline):
+            logger.error("Failed to set the timeline on a new pipeline")
+            return None
+        return pipeline
+    
+    def _prepare_export_pipeline(self, output_path: Union[str, Path], format_string: str):
+        """
+        Build a render pipeline for the current timeline, or None if export is not possible
+        """
+        if not self.timeline:
+            logger.error("No timeline available for export")
+            return None
+        
+        # Reuse the render pipeline unless the timeline was rebuilt; a
+        # GES.Pipeline's timeline can only be set once
+        export_pipeline = self._export_pipeline
+        if not self._pipeline_has_timeline(export_pipeline):
+            self._release_pipeline(export_pipeline)
+            self._export_pipeline = None
+            export_pipeline = self._pipeline_for_timeline()
+            if export_pipeline is None:
+                return None
+            self._export_pipeline = export_pipeline
+        else:
+            export_pipeline.set_state(Gst.State.NULL)
+        
+        # Encoding profiles are parsed once per format string
+        profile = _encoding_profile(format_string)
+        if not profile:
+            logger.error(f"Failed to create encoding profile: {format_string}")
+            return None
+        
+        # Set render settings
+        output_uri = Path(output_path).absolute().as_uri()
+        export_pipeline.set_render_settings(output_uri, profile)
+        export_pipeline.set_mode(GES.PipelineFlags.RENDER)
+        
+        # Commit timeline
+        self._commit_timeline()
+        return export_pipeline
+    
+    def export_timeline(self, output_path: Union[str, Path], format_string: str = "video/x-h264+audio/mpeg") -> bool:
         """
-        Export the timeline to a video file
+        Export the timeline to a video file, blocking until the render finishes.
+        The bus is polled with timed_pop_filtered, so no GLib main loop is needed.
         """
         if not self._check_ges_available():
             return False
             
         try:
-            if not self.timeline:
-                logger.error("No timeline available for export")
+            export_pipeline = self._prepare_export_pipeline(output_path, format_string)
+            if export_pipeline is None:
                 return False
+            return self._poll_export(export_pipeline, output_path, self._export_timeout())
             
-            # Create a new pipeline for export
-            export_pipeline = GES.Pipeline()
-            export_pipeline.set_timeline(self.timeline)
-            
-            # Create encoding profile
-            profile = Gst.EncodingProfile.from_string(format_string)
-            if not profile:
-                logger.error(f"Failed to create encoding profile: {format_string}")
+        except Exception as e:
+            logger.error(f"Error exporting timeline: {e}")
+            return False
+    
+    def _needs_render_pipeline(self, format_string: str) -> bool:
+        """
+        True unless stream copy is enabled and the timeline is a gap-free run of
+        main-track video clips whose streams already match format_string and the
+        timeline's size, frame rate and audio format, so they can be stream-copied.
+        Blocks on ffprobe for clips not yet probed.
+        """
+        if not EXPORT_STREAM_COPY or not self.timeline_data or not self.timeline_data.clips:
+            return True
+        
+        timeline_data = self.timeline_data
+        size = (timeline_data.width, timeline_data.height)
+        # The video track caps use an integer framerate
+        fps = int(timeline_data.frame_rate)
+        audio_format = (timeline_data.sample_rate, timeline_data.channels)
+        
+        targets = _target_codecs(format_string)
+        if "video" not in targets:
+            return True
+        
+        position = 0.0
+        reference = None
+        for clip in sorted(timeline_data.clips, key=lambda c: c.start):
+            # Overlays, other tracks and gaps all need compositing
+            if clip.type != "video" or clip.track != 0 or abs(clip.start - position) > 1e-3:
+                return True
+            position = clip.end
+            
+            path = _local_clip_path(clip.file_path)
+            info = _probe_streams(path) if path else None
+            if not info or info["video"] not in targets["video"]:
+                return True
+            if info["audio"] is not None and info["audio"] not in targets.get("audio", ()):
+                return True
+            
+            # The GES render would scale, retime or resample to the track caps
+            if info.get("size") != size or abs(info.get("fps", 0.0) - fps) > 1e-3:
+                return True
+            if info["audio"] is not None and info.get("audio_format") != audio_format:
+                return True
+            
+            # The concat demuxer needs identical stream layouts across inputs
+            layout = (info["video"], info["audio"], info.get("size"))
+            if reference is None:
+                reference = layout
+            elif layout != reference:
+                return True
+        
+        return False
+    
+    async def _stream_copy_export(self, output_path: Union[str, Path]) -> bool:
+        """Concatenate the timeline clips into output_path with ffmpeg -c copy"""
+        list_file = tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False)
+        try:
+            with list_file:
+                for clip in sorted(self.timeline_data.clips, key=lambda c: c.start):
+                    path = _local_clip_path(clip.file_path).replace("'", "'\\''")
+                    list_file.write(f"file '{path}'\n")
+                    list_file.write(f"inpoint {clip.in_point}\n")
+                    list_file.write(f"outpoint {clip.in_point + clip.duration}\n")
+            
+            process = await asyncio.create_subprocess_exec(
+                "ffmpeg", "-y", "-f", "concat", "-safe", "0", "-i", list_file.name,
+                "-c", "copy", str(output_path),
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.PIPE,
+            )
+            _, stderr = await process.communicate()
+            if process.returncode != 0:
+                logger.error(f"Stream-copy export failed: {stderr.decode(errors='replace')}")
                 return False
-            
-            # Set render settings
-            output_uri = f"file://{os.path.abspath(output_path)}"
-            export_pipeline.set_render_settings(output_uri, profile)
-            export_pipeline.set_mode(GES.PipelineFlags.RENDER)
-            
-            # Commit timeline
-            self.timeline.commit()
-            
-            # Setup export monitoring
-            bus = export_pipeline.get_bus()
-            bus.add_signal_watch()
-            
-            export_complete = threading.Event()
-            export_success = [False]  # Use list for closure
-            
-            def on_export_message(bus, message):
-                if message.type == Gst.MessageType.EOS:
-                    logger.info("Export completed successfully")
-                    export_success[0] = True
-                    export_complete.set()
-                elif message.type == Gst.MessageType.ERROR:
-                    err, debug = message.parse_error()
-                    logger.error(f"Export failed: {err.message}")
-                    export_complete.set()
-            
-            bus.connect("message", on_export_message)
-            
-            # Start export
+            return True
+        finally:
+            os.unlink(list_file.name)
+    
+    def _poll_export(
+        self,
+        export_pipeline: Any,
+        output_path: Union[str, Path],
+        timeout: float,
+        progress_callback: Optional[Callable[[float], None]] = None,
+    ) -> bool:
+        """
+        Play a prepared render pipeline and pop its bus until EOS, ERROR or
+        timeout. Blocks for the whole encode; progress_callback receives the
+        rendered fraction (0.0-1.0) between polls. The pipeline is back in NULL
+        when this returns.
+        """
+        try:
             ret = export_pipeline.set_state(Gst.State.PLAYING)
             if ret == Gst.StateChangeReturn.FAILURE:
                 logger.error("Failed to start export pipeline")
                 return False
             
-            # Wait for export to complete
-            logger.info(f"Starting export to {output_path}")
-            export_complete.wait(timeout=300)  # 5 minute timeout
+            logger.info("Starting export to %s", output_path)
+            bus = export_pipeline.get_bus()
+            message_types = Gst.MessageType.EOS | Gst.MessageType.ERROR
+            deadline = time.monotonic() + timeout
+            total_ns = self.timeline.get_duration()
+            
+            while time.monotonic() < deadline:
+                message = bus.timed_pop_filtered(EXPORT_POLL_INTERVAL_NS, message_types)
+                if message is None:
+                    if progress_callback and total_ns > 0:
+                        ok, position_ns = export_pipeline.query_position(Gst.Format.TIME)
+                        if ok:
+                            progress_callback(min(position_ns / total_ns, 1.0))
+                    continue
+                
+                if message.type == Gst.MessageType.EOS:
+                    logger.info("Export completed successfully")
+                    if progress_callback:
+                        progress_callback(1.0)
+                    return True
+                
+                err, debug = message.parse_error()
+                logger.error(f"Export failed: {err.message}")
+                return False
             
-            # Cleanup - let Python GI handle memory management
+            logger.error(f"Export timed out after {timeout}s: {output_path}")
+            return False
+        finally:
+            # Let Python GI handle memory management
             export_pipeline.set_state(Gst.State.NULL)
-            bus.remove_signal_watch()
-            # Don't call unref() - let Python GI handle it
-            export_pipeline = None  # Set to None after use
-            
-            return export_success[0]
+    
+    async def export_timeline_async(
+        self,
+        output_path: Union[str, Path],
+        format_string: str = "video/x-h264+audio/mpeg",
+        progress_callback: Optional[Callable[[float], None]] = None,
+        timeout: Optional[float] = None,
+    ) -> bool:
+        """
+        Export the timeline to a video file without blocking the event loop.
+        
+        Preparing the pipeline and polling its bus both run on one worker
+        thread per export. progress_callback receives the rendered fraction
+        (0.0-1.0) and is called on the event loop. timeout defaults to a
+        budget proportional to the timeline duration.
+        """
+        if not self._check_ges_available():
+            return False
+        
+        if not await asyncio.to_thread(self._needs_render_pipeline, format_string):
+            logger.info("Clips match %s, exporting with stream copy", format_string)
+            success = await self._stream_copy_export(output_path)
+            if success and progress_callback:
+                progress_callback(1.0)
+            return success
+        
+        on_progress = None
+        if progress_callback:
+            loop = asyncio.get_running_loop()
             
+            def on_progress(fraction: float):
+                loop.call_soon_threadsafe(progress_callback, fraction)
+        
+        def run() -> bool:
+            export_pipeline = self._prepare_export_pipeline(output_path, format_string)
+            if export_pipeline is None:
+                return False
+            return self._poll_export(
+                export_pipeline, output_path,
+                self._export_timeout() if timeout is None else timeout,
+                on_progress,
+            )
+        
+        try:
+            return await asyncio.to_thread(run)
         except Exception as e:
             logger.error(f"Error exporting timeline: {e}")
-            # Ensure cleanup even if errors occur
-            try:
-                if 'export_pipeline' in locals():
-                    export_pipeline.set_state(Gst.State.NULL)
-                    # Don't call unref() - let Python GI handle it
-                    export_pipeline = None  # Set to None after use
-            except:
-                pass
             return False
     
     def get_timeline_duration(self) -> float:
@@ -756,10 +1376,10 @@ class GESTimelineService:
         try:
             # Try to get duration from timeline
             duration_ns = self.timeline.get_duration()
-            duration_seconds = duration_ns / Gst.SECOND
+            duration_seconds = duration_ns / _NS
             
             if duration_seconds > 0:
-                logger.debug(f"Got timeline duration from GES: {duration_seconds}s")
+                logger.debug("Got timeline duration from GES: %ss", duration_seconds)
                 return duration_seconds
             else:
                 logger.debug("Timeline duration is 0, this might be normal for newly created timelines")
@@ -778,7 +1398,7 @@ class GESTimelineService:
             if not self.pipeline:
                 return False
             
-            position_ns = int(position_seconds * Gst.SECOND)
+            position_ns = int(position_seconds * _NS)
             
             seek_event = Gst.Event.new_seek(
                 1.0,  # rate
@@ -815,6 +1435,9 @@ class GESTimelineService:
                 finally:
                     self.pipeline = None
             
+            self._release_pipeline(self._export_pipeline)
+            self._export_pipeline = None
+            
             # Clean up timeline and its contents more carefully
             if self.timeline:
                 try:
@@ -832,47 +1455,29 @@ class GESTimelineService:
                                 try:
                                     layer.remove_clip(clip)
                                 except Exception as clip_error:
-                                    logger.debug(f"Error removing clip: {clip_error}")
+                                    logger.debug("Error removing clip: %s", clip_error)
                             
                             # Remove layer from timeline safely
                             try:
                                 self.timeline.remove_layer(layer)
                             except Exception as layer_error:
-                                logger.debug(f"Error removing layer: {layer_error}")
+                                logger.debug("Error removing layer: %s", layer_error)
                                 
                         except Exception as e:
-                            logger.debug(f"Error cleaning layer: {e}")
+                            logger.debug("Error cleaning layer: %s", e)
                     
-                    logger.info(f"Cleaned up {len(layers_list)} timeline layers")
+                    logger.info("Cleaned up %d timeline layers", len(layers_list))
                     
                 except Exception as e:
                     logger.warning(f"Error cleaning timeline layers: {e}")
                 finally:
                     self.timeline = None
+                    self._timeline_committed = False
             
             # Reset state
             self.is_running = False
             self.timeline_data = None
             
-            # Stop main loop if running
-            if self.main_loop:
-                try:
-                    if hasattr(self.main_loop, 'is_running') and self.main_loop.is_running():
-                        self.main_loop.quit()
-                except Exception as e:
-                    logger.debug(f"Error stopping main loop: {e}")
-                finally:
-                    self.main_loop = None
-            
-            # Wait for loop thread to finish
-            if self.loop_thread and self.loop_thread.is_alive():
-                try:
-                    self.loop_thread.join(timeout=2.0)
-                except Exception as e:
-                    logger.debug(f"Error joining loop thread: {e}")
-                finally:
-                    self.loop_thread = None
-            
             logger.info("✅ GES service cleanup completed successfully")
             
         except Exception as e:
@@ -880,21 +1485,29 @@ class GESTimelineService:
         finally:
             # Force reset state even if cleanup failed to prevent memory leaks
             self.timeline = None
+            self._timeline_committed = False
             self.pipeline = None
-            self.main_loop = None
-            self.loop_thread = None
+            self._export_pipeline = None
             self.is_running = False
             self.timeline_data = None
 
-# Global service instance
-_ges_service_instance: Optional[GESTimelineService] = None
+# Global service instance, created eagerly when GStreamer can be imported
+# (construction does not initialize GStreamer); recreated lazily after cleanup
+_ges_service_instance: Optional[GESTimelineService] = GESTimelineService() if GES_IMPORTS_AVAILABLE else None
+_ges_service_lock = threading.Lock()
 
 def get_ges_service() -> GESTimelineService:
-    """Get or create the global GES service instance"""
+    """Get or create the global GES service instance (created once, thread-safe)"""
     global _ges_service_instance
-    if _ges_service_instance is None:
-        _ges_service_instance = GESTimelineService()
-    return _ges_service_instance
+    instance = _ges_service_instance
+    if instance is not None:
+        return instance
+    
+    with _ges_service_lock:
+        # Double-check pattern
+        if _ges_service_instance is None:
+            _ges_service_instance = GESTimelineService()
+        return _ges_service_instance
 
 def cleanup_ges_service():
     """Cleanup the global GES service instance and uninitialize GStreamer"""
@@ -902,33 +1515,33 @@ def cleanup_ges_service():
     
     try:
         # Clean up service instance if it exists
-        if _ges_service_instance:
+        with _ges_service_lock:
+            instance, _ges_service_instance = _ges_service_instance, None
+        if instance:
             logger.info("Cleaning up GES service instance...")
-            _ges_service_instance.cleanup()
-            _ges_service_instance = None
+            instance.cleanup()
             logger.info("✅ GES service instance cleaned up")
         
         # Uninitialize GStreamer if it was initialized
-        with GES_INIT_LOCK:
-            if GES_INITIALIZED and GES_IMPORTS_AVAILABLE:
-                try:
-                    logger.info("Uninitializing GStreamer...")
-                    # Note: GStreamer doesn't have a proper uninit function
-                    # but we can mark it as uninitialized for our tracking
-                    GES_INITIALIZED = False
-                    logger.info("✅ GStreamer marked as uninitialized")
-                except Exception as e:
-                    logger.error(f"Error during GStreamer cleanup: {e}")
-            elif not GES_INITIALIZED:
-                logger.info("GStreamer was not initialized, nothing to cleanup")
+        if GES_INITIALIZED:
+            try:
+                logger.info("Uninitializing GStreamer...")
+                # Note: GStreamer doesn't have a proper uninit function
+                # but we can mark it as uninitialized for our tracking
+                GES_INITIALIZED = False
+                _clear_gst_caches()
+                logger.info("✅ GStreamer marked as uninitialized")
+            except Exception as e:
+                logger.error(f"Error during GStreamer cleanup: {e}")
+        else:
+            logger.info("GStreamer was not initialized, nothing to cleanup")
     
     except Exception as e:
         logger.error(f"Error during cleanup_ges_service: {e}")
         # Force cleanup even if errors occur
         try:
             _ges_service_instance = None
-            with GES_INIT_LOCK:
-                GES_INITIALIZED = False
+            GES_INITIALIZED = False
         except:
             pass
 
@@ -939,11 +1552,12 @@ def is_ges_available() -> bool:
 def get_ges_status() -> dict:
     """Get the current status of GES availability without triggering initialization"""
     # Return status without initializing GStreamer
+    initialized = GES_INITIALIZED
     return {
-        "available": GES_INITIALIZED and GES_IMPORTS_AVAILABLE and not GES_FORCE_DISABLED,
+        "available": initialized and GES_IMPORTS_AVAILABLE and not GES_FORCE_DISABLED,
         "has_imports": GES_IMPORTS_AVAILABLE,
-        "has_ges": GES_INITIALIZED,
-        "initialized": GES_INITIALIZED,
+        "has_ges": initialized,
+        "initialized": initialized,
         "force_disabled": GES_FORCE_DISABLED,
         "using_stubs": GES_USING_STUBS,
         "disable_reason": "malloc errors from threading conflicts" if GES_FORCE_DISABLED else None
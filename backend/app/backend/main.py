@@ -1,6 +1,7 @@
 from dotenv import load_dotenv
 load_dotenv(override=True)
 from pathlib import Path
+from contextlib import asynccontextmanager
 import os
 
 env_path = Path(__file__).resolve().parent.parent.parent / '.env'
@@ -8,6 +9,7 @@ load_dotenv(dotenv_path=env_path)
 
 print("DEBUG OPENAI_API_KEY:", os.getenv("OPENAI_API_KEY"))
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from app.backend.timeline_api import router as timeline_router
 from app.backend.command_api import router as command_router
@@ -42,7 +44,7 @@ except Exception as e:
 
 # Try to import Export API with error handling
 try:
-    from app.backend.export_api import router as export_router
+    from app.backend.export_api import router as export_router, start_export_cleanup, stop_export_cleanup
     EXPORT_ROUTER_AVAILABLE = True
     print("✅ Export router loaded successfully")
 except Exception as e:
@@ -58,7 +60,18 @@ except Exception as e:
     PERFORMANCE_ROUTER_AVAILABLE = False
     print(f"⚠️ Performance router disabled due to import error: {e}")
 
-app = FastAPI()
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Background tasks owned by the routers are started and stopped with the app
+    if EXPORT_ROUTER_AVAILABLE:
+        await start_export_cleanup()
+    try:
+        yield
+    finally:
+        if EXPORT_ROUTER_AVAILABLE:
+            await stop_export_cleanup()
+
+app = FastAPI(default_response_class=ORJSONResponse, lifespan=lifespan)
 
 # Add CORS middleware
 app.add_middleware(
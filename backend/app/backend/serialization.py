@@ -0,0 +1,15 @@
+"""
+JSON encoding shared by the API routers.
+
+orjson is a hard dependency (main.py serves ORJSONResponse by default), so
+prebuilt response bodies use it directly.
+"""
+
+from typing import Any
+
+import orjson
+
+
+def dumps(obj: Any) -> bytes:
+    """Serialize obj to JSON bytes"""
+    return orjson.dumps(obj)
@@ -1,5 +1,6 @@
 import os
-from typing import Optional
+import tempfile
+from typing import Callable, Optional
 from app.timeline import Timeline
 import subprocess
 
@@ -300,20 +301,27 @@ class FFMpegPipeline:
         # Reason: This command combines video, audio, and subtitle tracks using concat demuxer and stream mapping.
         return command
 
-    def render_export(self, export_path: str, quality: str = "high") -> None:
+    def render_export(self, export_path: str, quality: str = "high",
+                      progress_callback: Optional[Callable[[float], None]] = None,
+                      duration_seconds: Optional[float] = None) -> None:
         """
         Render/export the current timeline to a high-quality video file using ffmpeg.
 
         Args:
             export_path (str): Path to the output video file.
             quality (str): Export quality setting (e.g., 'high', 'medium', 'low').
+            progress_callback (callable, optional): Called with a 0.0-1.0 fraction as ffmpeg reports progress.
+            duration_seconds (float, optional): Expected output duration, required for progress reporting.
 
         Raises:
             RuntimeError: If export fails.
         """
         ffmpeg_cmd = self.generate_ffmpeg_command(export_path, quality)
         try:
-            result = subprocess.run(ffmpeg_cmd, check=True, capture_output=True, text=True)
+            if progress_callback and duration_seconds:
+                self._run_with_progress(ffmpeg_cmd, progress_callback, duration_seconds)
+            else:
+                result = subprocess.run(ffmpeg_cmd, check=True, capture_output=True, text=True)
         except subprocess.CalledProcessError as e:
             error_msg = f"ffmpeg export failed: {e.stderr}\nCommand: {' '.join(ffmpeg_cmd)}"
             raise RuntimeError(error_msg) from e
@@ -326,6 +334,33 @@ class FFMpegPipeline:
                 os.remove(fname)
         return None
 
+    @staticmethod
+    def _run_with_progress(command: list, progress_callback: Callable[[float], None], duration_seconds: float) -> None:
+        """
+        Run ffmpeg with machine-readable progress on stdout, reporting the completed fraction.
+
+        Raises:
+            subprocess.CalledProcessError: If ffmpeg exits with a non-zero status.
+        """
+        # ffmpeg reports out_time_us (and the misnamed out_time_ms) in microseconds
+        total_us = duration_seconds * 1_000_000
+        command = command[:2] + ["-progress", "pipe:1", "-nostats"] + command[2:]
+        # stderr goes to a temp file so a chatty ffmpeg can't block on a full pipe
+        with tempfile.TemporaryFile(mode="w+") as stderr_file:
+            process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=stderr_file, text=True)
+            for line in process.stdout:
+                key, _, value = line.partition("=")
+                if key in ("out_time_us", "out_time_ms"):
+                    try:
+                        progress_callback(min(int(value) / total_us, 1.0))
+                    except ValueError:
+                        pass
+            returncode = process.wait()
+            if returncode != 0:
+                stderr_file.seek(0)
+                raise subprocess.CalledProcessError(returncode, command, stderr=stderr_file.read())
+        progress_callback(1.0)
+
     def render_preview(self, preview_path: str = "preview.mp4") -> None:
         """
         Render a low-res/fast preview of the timeline for UI playback.
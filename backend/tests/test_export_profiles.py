@@ -0,0 +1,50 @@
+import pytest
+from app.backend.export_profiles import ProfessionalExportProfiles, _parse_bitrate
+
+@pytest.fixture
+def service():
+    return ProfessionalExportProfiles()
+
+def test_parse_bitrate():
+    assert _parse_bitrate("8000k") == 8000
+    assert _parse_bitrate("192K") == 192
+    assert _parse_bitrate("2M") == 2000
+    assert _parse_bitrate("2.5m") == 2500
+    assert _parse_bitrate(None) is None
+    assert _parse_bitrate("variable") is None
+
+def test_profile_bitrates_parsed_at_construction(service):
+    profile = service.get_profile("youtube_1080p_h264")
+    assert profile.video_kbps == 8000
+    assert profile.audio_kbps == 192
+    crf_profile = service.get_profile("web_1080p_h264")
+    assert crf_profile.video_kbps is None
+
+def test_estimate_file_size(service):
+    profile = service.get_profile("youtube_1080p_h264")
+    # (8000 + 192) kbps / 8192 -> MB/s
+    assert service.estimate_file_size(profile, 60) == pytest.approx(60.0)
+    crf_profile = service.get_profile("web_1080p_h264")
+    assert service.estimate_file_size(crf_profile, 10) == pytest.approx((4 + 128 / 8192) * 10)
+
+def test_generate_ffmpeg_args(service):
+    profile = service.get_profile("youtube_1080p_h264")
+    args = service.generate_ffmpeg_args(profile, "in.mp4", "out.mp4")
+    assert args[:4] == ["ffmpeg", "-y", "-i", "in.mp4"]
+    assert args[-1] == "out.mp4"
+    assert args[4:6] == ["-c:v", "libx264"]
+    assert "-b:v" in args and "-crf" not in args
+    assert args[-3:-1] == ["-movflags", "+faststart"]
+    crf_args = service.generate_ffmpeg_args(service.get_profile("web_720p_h264"), "a", "b")
+    assert crf_args[crf_args.index("-crf") + 1] == "25"
+
+def test_get_profiles_by_category(service):
+    from app.backend.export_profiles import ExportCategory
+    web_ids = [p.id for p in service.get_profiles_by_category(ExportCategory.WEB)]
+    assert web_ids == ["web_1080p_h264", "web_720p_h264"]
+    assert service.get_profiles_by_category(ExportCategory.CINEMA) == []
+
+def test_search_profiles(service):
+    assert {p.id for p in service.search_profiles("instagram")} == {"instagram_feed_1080", "instagram_story_1080"}
+    assert [p.id for p in service.search_profiles("PRORES 422")] == ["broadcast_1080p_prores"]
+    assert service.search_profiles("no such profile") == []
@@ -0,0 +1,225 @@
+import time
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+import app.backend.ges_api as ges_api
+
+
+class FakeGESService:
+    """Stands in for GESTimelineService; exports to *_fail paths fail, *_raise paths raise"""
+    export_seconds = 0.05
+
+    async def export_timeline_async(self, output_path, format_string, progress_callback=None):
+        progress_callback(0.5)
+        await ges_api.asyncio.sleep(self.export_seconds)
+        if output_path.stem.endswith("_raise"):
+            raise RuntimeError("encoder crashed")
+        return not output_path.stem.endswith("_fail")
+
+
+@pytest.fixture
+def service():
+    return FakeGESService()
+
+
+@pytest.fixture
+def client(service):
+    ges_api._export_jobs.clear()
+    ges_api._export_progress.clear()
+    app = FastAPI()
+    app.include_router(ges_api.router, prefix="/api")
+    app.dependency_overrides[ges_api.ges_dep] = lambda: service
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+def _wait_for_export(client, job_id):
+    for _ in range(100):
+        body = client.get(f"/api/ges/export/{job_id}").json()
+        if body["data"]["status"] in ("completed", "failed"):
+            return body
+        time.sleep(0.01)
+    raise AssertionError(f"export {job_id} did not finish")
+
+
+def test_export_returns_job_id(client, tmp_path):
+    response = client.post("/api/ges/export", json={"output_path": str(tmp_path / "out" / "a.mp4")})
+    assert response.status_code == 200
+    data = response.json()["data"]
+    assert data["format"] == "video/x-h264+audio/mpeg"
+    assert data["job_id"] in ges_api._export_jobs
+    assert (tmp_path / "out").is_dir()
+
+
+def test_export_job_completes(client, tmp_path):
+    job_id = client.post("/api/ges/export", json={"output_path": str(tmp_path / "a.mp4")}).json()["data"]["job_id"]
+    body = _wait_for_export(client, job_id)
+    assert body["success"] is True
+    assert body["data"] == {"job_id": job_id, "status": "completed"}
+
+
+@pytest.mark.parametrize("name", ["b_fail.mp4", "b_raise.mp4"])
+def test_export_job_fails(client, tmp_path, name):
+    job_id = client.post("/api/ges/export", json={"output_path": str(tmp_path / name)}).json()["data"]["job_id"]
+    body = _wait_for_export(client, job_id)
+    assert body["success"] is False
+    assert body["data"]["status"] == "failed"
+
+
+def test_unknown_export_job(client):
+    assert client.get("/api/ges/export/missing").status_code == 404
+
+
+def test_export_queue_full(client, service, tmp_path, monkeypatch):
+    monkeypatch.setattr(ges_api, "MAX_PENDING_EXPORTS", 1)
+    service.export_seconds = 0.2
+    first = client.post("/api/ges/export", json={"output_path": str(tmp_path / "a.mp4")})
+    assert first.status_code == 200
+    assert client.post("/api/ges/export", json={"output_path": str(tmp_path / "b.mp4")}).status_code == 429
+    _wait_for_export(client, first.json()["data"]["job_id"])
+    assert client.post("/api/ges/export", json={"output_path": str(tmp_path / "c.mp4")}).status_code == 200
+
+
+class FakeSeekService:
+    """Preview stand-in recording seeks; seeking to a negative position fails"""
+
+    def __init__(self):
+        self.pipeline = object()
+        self.seeks = []
+
+    def seek_to_position(self, position):
+        self.seeks.append(position)
+        return position >= 0
+
+
+@pytest.fixture
+def seek_service():
+    return FakeSeekService()
+
+
+@pytest.fixture
+def seek_client(seek_service):
+    app = FastAPI()
+    app.include_router(ges_api.router, prefix="/api")
+    app.dependency_overrides[ges_api.ges_dep] = lambda: seek_service
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+def _seek_outcomes(websocket, count):
+    """The first count "seek" outcome events, keyed by seek_id"""
+    outcomes = {}
+    while len(outcomes) < count:
+        event = websocket.receive_json()
+        if event["type"] == "seek":
+            outcomes[event["seek_id"]] = event
+    return outcomes
+
+
+def test_seeks_from_one_client_are_coalesced(seek_client, seek_service, monkeypatch):
+    # Wide enough that all three requests land inside one window
+    monkeypatch.setattr(ges_api, "SEEK_COALESCE_SECONDS", 0.5)
+    with seek_client.websocket_connect("/api/ges/events") as websocket:
+        seek_ids = [
+            seek_client.post("/api/ges/seek", json={"position": position}).json()["data"]["seek_id"]
+            for position in (1.0, 2.0, 3.0)
+        ]
+        outcomes = _seek_outcomes(websocket, 3)
+    assert seek_service.seeks == [3.0]
+    assert [outcomes[seek_id]["status"] for seek_id in seek_ids] == ["superseded", "superseded", "completed"]
+    assert outcomes[seek_ids[-1]]["current_time"] == 3.0
+
+
+def test_seeks_from_different_clients_are_kept(seek_client, seek_service):
+    with seek_client.websocket_connect("/api/ges/events") as websocket:
+        for client_id, position in (("a", 1.0), ("b", 2.0)):
+            response = seek_client.post("/api/ges/seek", json={"position": position, "client_id": client_id})
+            assert response.status_code == 202
+        _seek_outcomes(websocket, 2)
+    assert sorted(seek_service.seeks) == [1.0, 2.0]
+
+
+def test_failed_seek_is_reported(seek_client):
+    with seek_client.websocket_connect("/api/ges/events") as websocket:
+        seek_id = seek_client.post("/api/ges/seek", json={"position": -1.0}).json()["data"]["seek_id"]
+        outcome = _seek_outcomes(websocket, 1)[seek_id]
+    assert outcome["status"] == "failed"
+    assert outcome["position"] == -1.0
+
+
+def test_seek_without_preview_fails(seek_client, seek_service):
+    seek_service.pipeline = None
+    response = seek_client.post("/api/ges/seek", json={"position": 1.0})
+    assert response.status_code == 500
+    assert seek_service.seeks == []
+
+
+SNAP_CLIPS = [
+    {"id": "a", "name": "A", "start": 0.0, "end": 4.0, "duration": 4.0, "file_path": "a.mp4", "type": "video"},
+    {"id": "b", "name": "B", "start": 6.0, "end": 10.0, "duration": 4.0, "file_path": "b.mp4", "type": "video"},
+    {"id": "c", "name": "C", "start": 2.0, "end": 8.0, "duration": 6.0, "file_path": "c.mp4", "type": "video", "track": 1},
+]
+
+
+@pytest.fixture
+def snap_client():
+    ges_api._snap_cache.clear()
+    app = FastAPI()
+    app.include_router(ges_api.router, prefix="/api")
+    return TestClient(app)
+
+
+def _snap(client, target, clips=SNAP_CLIPS, **options):
+    response = client.post("/api/ges/snap-to-clips", json={"target_position": target, "clips": clips, **options})
+    assert response.status_code == 200
+    return response.json()["data"]
+
+
+def test_snap_empty_timeline(snap_client):
+    data = _snap(snap_client, 1.5, clips=[])
+    assert (data["snapped_position"], data["snap_type"], data["all_snap_points"]) == (0.0, "timeline_start", [0.0])
+    assert _snap(snap_client, 3.0, clips=[])["snapped"] is False
+    data = _snap(snap_client, 1.5, clips=[], include_timeline_markers=False)
+    assert data["snapped"] is False and data["all_snap_points"] == []
+
+
+def test_snap_points_and_nearest_clip_edge(snap_client):
+    data = _snap(snap_client, 5.8)
+    assert data["all_snap_points"] == [0.0, 2.0, 4.0, 5.0, 6.0, 8.0, 10.0]
+    assert data["snapped_position"] == 6.0
+    assert data["snap_distance"] == pytest.approx(0.2)
+    assert data["snap_type"] == "clip_start"
+    assert data["insertion_index"] == 2
+
+
+def test_snap_tie_goes_to_smaller_point(snap_client):
+    # 6.0 (B start) and 8.0 (C end, B/C centre) are both 1.0 away
+    data = _snap(snap_client, 7.0)
+    assert (data["snapped_position"], data["snap_type"]) == (6.0, "clip_start")
+
+
+def test_snap_track_filter(snap_client):
+    data = _snap(snap_client, 5.8, track_filter=1, snap_threshold=1.0)
+    assert (data["snapped_position"], data["snap_type"]) == (5.0, "clip_center")
+    assert data["insertion_index"] == 1
+    assert data["all_snap_points"] == [0.0, 2.0, 5.0, 8.0, 10.0]
+
+
+def test_snap_include_markers(snap_client):
+    data = _snap(snap_client, 9.5, track_filter=1)
+    assert (data["snapped_position"], data["snap_type"]) == (10.0, "timeline_end")
+    data = _snap(snap_client, 9.5, track_filter=1, include_timeline_markers=False)
+    assert (data["snapped_position"], data["snap_type"]) == (8.0, "clip_center")
+    assert data["all_snap_points"] == [2.0, 5.0, 8.0]
+
+
+def test_snap_threshold_boundary(snap_client):
+    data = _snap(snap_client, 12.0, snap_threshold=2.0)
+    assert data["snapped"] is True
+    assert (data["snapped_position"], data["snap_distance"], data["snap_type"]) == (10.0, 2.0, "timeline_end")
+    assert data["insertion_index"] == 2
+    data = _snap(snap_client, 12.0, snap_threshold=1.99)
+    assert data["snapped"] is False
+    assert (data["snapped_position"], data["snap_distance"], data["snap_type"]) == (12.0, 0.0, "none")
@@ -0,0 +1,180 @@
+import asyncio
+import json
+import subprocess
+
+import pytest
+
+import app.backend.ges_service as ges_service
+from app.backend.ges_service import GESTimelineService, TimelineClip, TimelineData
+
+MATCHING_STREAMS = {
+    "video": "h264",
+    "audio": "aac",
+    "size": (1920, 1080),
+    "fps": 30.0,
+    "audio_format": (48000, 2),
+}
+
+
+def _clip(clip_id, start, end, **kwargs):
+    return TimelineClip(
+        id=clip_id, name=clip_id, start=start, end=end, duration=end - start,
+        file_path=f"/media/{clip_id}.mp4", **kwargs
+    )
+
+
+@pytest.fixture
+def probed(monkeypatch):
+    """Every clip probes as the returned dict; tests mutate it to introduce mismatches"""
+    streams = dict(MATCHING_STREAMS)
+    monkeypatch.setattr(ges_service, "_probe_streams", lambda path: streams)
+    monkeypatch.setattr(ges_service, "EXPORT_STREAM_COPY", True)
+    return streams
+
+
+@pytest.fixture
+def service():
+    service = GESTimelineService()
+    service._ges_ok = True
+    service.timeline_data = TimelineData(clips=[_clip("a", 0, 2), _clip("b", 2, 5)])
+    return service
+
+
+def test_target_codecs():
+    assert ges_service._target_codecs("video/x-h264+audio/aac") == {"video": {"h264"}, "audio": {"aac"}}
+    assert ges_service._target_codecs("video/x-vp9+audio/x-opus")["video"] == {"vp9"}
+
+
+def test_probe_streams_reads_ffprobe_output(monkeypatch, tmp_path):
+    media = tmp_path / "clip.mp4"
+    media.write_bytes(b"")
+    output = {"streams": [
+        {"codec_type": "video", "codec_name": "h264", "width": 1280, "height": 720, "r_frame_rate": "30000/1001"},
+        {"codec_type": "audio", "codec_name": "aac", "sample_rate": "44100", "channels": 2},
+    ]}
+    monkeypatch.setattr(
+        ges_service.subprocess, "run",
+        lambda *args, **kwargs: subprocess.CompletedProcess(args, 0, stdout=json.dumps(output))
+    )
+    ges_service._probe_cache.clear()
+    info = ges_service._probe_streams(str(media))
+    assert info["video"] == "h264" and info["audio"] == "aac"
+    assert info["size"] == (1280, 720)
+    assert info["fps"] == pytest.approx(29.97, abs=1e-2)
+    assert info["audio_format"] == (44100, 2)
+
+
+def test_matching_clips_are_stream_copied(service, probed):
+    assert service._needs_render_pipeline("video/x-h264+audio/aac") is False
+
+
+def test_stream_copy_is_opt_in(service, probed, monkeypatch):
+    monkeypatch.setattr(ges_service, "EXPORT_STREAM_COPY", False)
+    assert service._needs_render_pipeline("video/x-h264+audio/aac") is True
+
+
+@pytest.mark.parametrize("key, value", [
+    ("video", "hevc"),
+    ("audio", "mp3"),
+    ("size", (1280, 720)),
+    ("fps", 25.0),
+    ("audio_format", (44100, 2)),
+])
+def test_stream_mismatch_needs_render(service, probed, key, value):
+    probed[key] = value
+    assert service._needs_render_pipeline("video/x-h264+audio/aac") is True
+
+
+@pytest.mark.parametrize("clips", [
+    [_clip("a", 0, 2), _clip("b", 3, 5)],  # gap
+    [_clip("a", 0, 2), _clip("b", 2, 5, track=1)],  # overlay track
+    [_clip("a", 0, 2), _clip("t", 2, 5, type="text")],  # text clip
+])
+def test_timeline_layout_needs_render(service, probed, clips):
+    service.timeline_data = TimelineData(clips=clips)
+    assert service._needs_render_pipeline("video/x-h264+audio/aac") is True
+
+
+def test_export_uses_stream_copy_when_clips_match(service, probed, monkeypatch):
+    copied = []
+
+    async def stream_copy(output_path):
+        copied.append(output_path)
+        return True
+
+    monkeypatch.setattr(service, "_stream_copy_export", stream_copy)
+    monkeypatch.setattr(service, "_prepare_export_pipeline", lambda *args: pytest.fail("rendered"))
+    progress = []
+    assert asyncio.run(service.export_timeline_async("/tmp/out.mp4", "video/x-h264+audio/aac", progress.append))
+    assert copied == ["/tmp/out.mp4"]
+    assert progress == [1.0]
+
+
+def test_export_falls_back_to_render(service, probed, monkeypatch):
+    probed["fps"] = 25.0
+    prepared = []
+    monkeypatch.setattr(service, "_stream_copy_export", lambda output_path: pytest.fail("stream copied"))
+    monkeypatch.setattr(service, "_prepare_export_pipeline", lambda *args: prepared.append(args))
+    assert asyncio.run(service.export_timeline_async("/tmp/out.mp4", "video/x-h264+audio/aac")) is False
+    assert prepared == [("/tmp/out.mp4", "video/x-h264+audio/aac")]
+
+
+class FakeElement:
+    def __init__(self, properties):
+        self.properties = dict.fromkeys(properties)
+
+    def find_property(self, name):
+        return name if name in self.properties else None
+
+    def set_property(self, name, value):
+        self.properties[name] = value
+
+
+class FakeBin(FakeElement):
+    """Auto sink stand-in that emits child-added the way GstChildProxy does"""
+
+    def __init__(self):
+        super().__init__([])
+        self.handlers = []
+
+    def connect(self, signal, handler):
+        assert signal == "child-added"
+        self.handlers.append(handler)
+
+    def add_child(self, child, name):
+        for handler in self.handlers:
+            handler(self, child, name)
+
+
+def test_sink_properties_reach_auto_sink_child(monkeypatch):
+    monkeypatch.setattr(ges_service.Gst, "Bin", FakeBin, raising=False)
+    sink = FakeBin()
+    ges_service._tune_sink_properties(sink, {"buffer-time": 20000, "latency-time": 10000})
+    child = FakeElement(["buffer-time", "latency-time"])
+    sink.add_child(child, "autoaudiosink0-actual-sink-pulse")
+    assert child.properties == {"buffer-time": 20000, "latency-time": 10000}
+
+
+def test_sink_properties_skip_unsupported(monkeypatch):
+    monkeypatch.setattr(ges_service.Gst, "Bin", FakeBin, raising=False)
+    sink = FakeElement(["buffer-time"])
+    ges_service._tune_sink_properties(sink, {"buffer-time": 20000, "latency-time": 10000})
+    assert sink.properties == {"buffer-time": 20000}
+
+
+def test_failed_ges_init_is_retried(monkeypatch):
+    attempts = []
+
+    def gst_init(argv):
+        attempts.append(argv)
+        if len(attempts) == 1:
+            raise RuntimeError("no display")
+
+    monkeypatch.setattr(ges_service, "GES_IMPORTS_AVAILABLE", True)
+    monkeypatch.setattr(ges_service, "GES_INITIALIZED", False)
+    monkeypatch.setattr(ges_service.Gst, "init", gst_init, raising=False)
+    monkeypatch.setattr(ges_service.GES, "init", lambda: None, raising=False)
+    assert ges_service._initialize_ges() is False
+    assert ges_service._initialize_ges() is True
+    assert ges_service._initialize_ges() is True
+    assert len(attempts) == 2
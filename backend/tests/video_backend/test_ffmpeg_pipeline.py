@@ -53,6 +53,29 @@ def test_render_export(monkeypatch, tmp_path):
     pipeline.render_export(export_path)
     assert os.path.exists(export_path)
 
+def test_render_export_reports_progress(monkeypatch, tmp_path):
+    """
+    Test that render_export parses ffmpeg -progress output into fractions (mocked).
+    """
+    timeline, video_path, audio_path = make_simple_timeline(tmp_path)
+    pipeline = FFMpegPipeline(timeline)
+    export_path = str(tmp_path / "out.mp4")
+    seen_commands = []
+    class MockProcess:
+        def __init__(self, cmd, stdout, stderr, text):
+            seen_commands.append(cmd)
+            with open(cmd[-1], "wb") as f:
+                f.write(b"\x00")
+            self.stdout = iter(["frame=10\n", "out_time_us=5000000\n", "out_time_us=N/A\n", "out_time_ms=10000000\n", "progress=end\n"])
+        def wait(self):
+            return 0
+    monkeypatch.setattr(subprocess, "Popen", MockProcess)
+    fractions = []
+    pipeline.render_export(export_path, progress_callback=fractions.append, duration_seconds=10.0)
+    assert fractions == [0.5, 1.0, 1.0]
+    assert seen_commands[0][:5] == ["ffmpeg", "-y", "-progress", "pipe:1", "-nostats"]
+    assert os.path.exists(export_path)
+
 def test_render_export_failure(monkeypatch):
     """
     Test that render_export raises RuntimeError if ffmpeg fails (mocked).